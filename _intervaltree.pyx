@@ -0,0 +1,201 @@
+# cython: language_level=3
+#	1.	Cython version of the interval tree in redblack-interval.py. Nodes are cdef classes, so lo, hi,
+#       max_endpoint and the child links are C struct fields instead of Python attributes.
+#	2.	Rotations, the insert fix-up and the max endpoint updates are cdef methods; insert and
+#       overlap_search are cpdef, so Python code can still call them.
+#	3.	Endpoints are compared as C doubles, but each node keeps the tuple it was given, so queries
+#       return the intervals exactly as they were inserted.
+#	4.	Build it in place with `cythonize -i _intervaltree.pyx` (needs `pip install cython` and a C compiler).
+#       redblack-interval.py then routes FastIntervalTree's plain inserts and queries through it.
+
+cdef enum:
+    RED = 0
+    BLACK = 1
+
+
+cdef class CNode:
+    cdef public double lo, hi
+    cdef public double max_endpoint  # Augmented data: maximum endpoint in the subtree
+    cdef public CNode left, right, parent
+    cdef public int color
+    cdef readonly object interval  # The tuple as inserted, so int endpoints come back as ints
+
+    def __init__(self, double lo=float('-inf'), double hi=float('-inf'), CNode NIL_LEAF=None, interval=None):
+        self.lo = lo
+        self.hi = hi
+        self.interval = (lo, hi) if interval is None else interval
+        self.max_endpoint = hi
+        self.color = RED  # New nodes are always red
+        self.left = NIL_LEAF
+        self.right = NIL_LEAF
+        self.parent = None
+
+
+cdef class IntervalTree:
+    cdef public CNode NIL_LEAF
+    cdef public CNode root
+
+    def __init__(self):
+        self.NIL_LEAF = CNode()
+        self.NIL_LEAF.color = BLACK  # The NIL node is black; its lo, hi and max_endpoint default to -inf
+        # NIL_LEAF.parent is scratch space: rotations may overwrite it and nothing reads it
+        self.root = self.NIL_LEAF
+
+    cdef void rotate_left(self, CNode node):
+        cdef CNode right_child = node.right
+        node.right = right_child.left
+        right_child.left.parent = node  # No NIL check: NIL_LEAF.parent is scratch
+        right_child.parent = node.parent
+        if node.parent is None:
+            self.root = right_child
+        elif node is node.parent.left:
+            node.parent.left = right_child
+        else:
+            node.parent.right = right_child
+        right_child.left = node
+        node.parent = right_child
+
+        # Update max_endpoint after rotation
+        self.update_max_endpoint(node)
+        self.update_max_endpoint(right_child)
+
+    cdef void rotate_right(self, CNode node):
+        cdef CNode left_child = node.left
+        node.left = left_child.right
+        left_child.right.parent = node  # No NIL check: NIL_LEAF.parent is scratch
+        left_child.parent = node.parent
+        if node.parent is None:
+            self.root = left_child
+        elif node is node.parent.right:
+            node.parent.right = left_child
+        else:
+            node.parent.left = left_child
+        left_child.right = node
+        node.parent = left_child
+
+        # Update max_endpoint after rotation
+        self.update_max_endpoint(node)
+        self.update_max_endpoint(left_child)
+
+    cdef void fix_insert(self, CNode node):
+        cdef CNode parent, grand, uncle
+        while node is not self.root and node.parent.color == RED:
+            parent = node.parent
+            grand = parent.parent
+            if parent is grand.left:
+                uncle = grand.right
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
+                else:
+                    if node is parent.right:
+                        node = parent
+                        self.rotate_left(node)
+                        parent = node.parent  # The rotation moved node below its old child
+                    parent.color = BLACK
+                    grand.color = RED
+                    self.rotate_right(grand)
+            else:
+                uncle = grand.left
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
+                else:
+                    if node is parent.left:
+                        node = parent
+                        self.rotate_right(node)
+                        parent = node.parent  # The rotation moved node below its old child
+                    parent.color = BLACK
+                    grand.color = RED
+                    self.rotate_left(grand)
+        self.root.color = BLACK
+
+    cpdef void insert(self, interval):
+        lo_obj, hi_obj = interval
+        cdef double low = lo_obj, high = hi_obj
+        cdef CNode new_node = CNode(low, high, self.NIL_LEAF, (lo_obj, hi_obj))  # Create a new node with NIL_LEAF as children
+        cdef CNode parent = None
+        cdef CNode current = self.root
+
+        while current is not self.NIL_LEAF:
+            parent = current
+            if low < current.lo:
+                current = current.left
+            else:
+                current = current.right
+
+        new_node.parent = parent
+
+        if parent is None:
+            self.root = new_node
+        elif low < parent.lo:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        # Raise max_endpoint on the ancestors before fixing up: rotations recompute from the
+        # children, so they only produce correct values once the children are already correct
+        self._bubble_max(parent, high)
+        self.fix_insert(new_node)
+
+    cdef void update_max_endpoint(self, CNode node):
+        if node is self.NIL_LEAF:
+            return
+
+        # Max endpoint is the maximum of the node's high end and the max_endpoints of its children
+        node.max_endpoint = max(node.hi, node.left.max_endpoint, node.right.max_endpoint)
+
+    cdef void _bubble_max(self, CNode node, double new_high):
+        # A new interval can only raise an ancestor's max_endpoint, and once one ancestor is already
+        # at least new_high, every ancestor above it is too
+        while node is not None and new_high > node.max_endpoint:
+            node.max_endpoint = new_high
+            node = node.parent
+
+    cpdef overlap_search(self, interval):
+        """Search for any interval in the tree that overlaps with the given interval."""
+        cdef double low, high
+        low, high = interval
+        cdef CNode node = self.root
+        while node is not self.NIL_LEAF:
+            if node.lo <= high and low <= node.hi:
+                return node.interval
+            if node.left is not self.NIL_LEAF and node.left.max_endpoint >= low:
+                node = node.left
+            else:
+                node = node.right
+        return None
+
+    def intervals(self):
+        # Every stored interval, in order of low end
+        out = []
+        stack = []
+        cdef CNode current = self.root
+        while stack or current is not self.NIL_LEAF:
+            while current is not self.NIL_LEAF:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            out.append(current.interval)
+            current = current.right
+        return out
+
+    def inorder_traversal(self, CNode node, out=None):
+        # Collect one string per node and print them in a single call; pass a list as out to
+        # receive the strings instead
+        parts = [] if out is None else out
+        stack = []
+        cdef CNode current = node
+        while stack or current is not self.NIL_LEAF:
+            while current is not self.NIL_LEAF:
+                stack.append(current)
+                current = current.left
+            node = stack.pop()
+            parts.append(f'({node.lo:g}, {node.hi:g}) (max={node.max_endpoint:g})')
+            current = node.right
+        if out is None:
+            print(' '.join(parts), end=' ')
@@ -1,7 +1,12 @@
+RED = 0
+BLACK = 1
+
 class Node:
+    __slots__ = ('data', 'color', 'left', 'right', 'parent')
+
     def __init__(self, data):
         self.data = data
-        self.color = 'RED'  # New nodes are always red
+        self.color = RED  # New nodes are always red
         self.left = None
         self.right = None
         self.parent = None
@@ -10,18 +15,56 @@ class Node:
 class RedBlackTree:
     def __init__(self):
         self.NIL_LEAF = Node(None)
-        self.NIL_LEAF.color = 'BLACK'  # NIL nodes are always black
+        self.NIL_LEAF.color = BLACK  # NIL nodes are always black
+        # NIL_LEAF.parent is scratch space: rotations may overwrite it, and only delete reads it,
+        # right after setting it
         self.root = self.NIL_LEAF
+        self._node_pool = []  # Nodes released by _recycle, ready for reuse
+        self._descend = self._make_descend()
+
+    def _make_descend(self):
+        # Build the BST descent once per tree. The closure holds this tree's NIL_LEAF in a closure
+        # cell and compares the plain key, so the loop does no self.* lookups per level.
+        NIL_LEAF = self.NIL_LEAF
+
+        def descend(current, data):
+            # Return the node a new key should hang under, or None if the tree is empty
+            parent = None
+            while current is not NIL_LEAF:
+                parent = current
+                if data < current.data:
+                    current = current.left
+                else:
+                    current = current.right
+            return parent
+
+        return descend
+
+    def _new_node(self, data):
+        # Reuse a node handed back by _recycle before allocating a fresh one
+        if not self._node_pool:
+            node = Node(data)
+        else:
+            node = self._node_pool.pop()
+            node.__init__(data)
+        node.left = self.NIL_LEAF
+        node.right = self.NIL_LEAF
+        return node
+
+    def _recycle(self, node):
+        # Drop the node's links so it keeps nothing alive while it sits in the pool
+        node.data = None
+        node.left = node.right = node.parent = None
+        self._node_pool.append(node)
 
     def rotate_left(self, node):
         right_child = node.right
         node.right = right_child.left
-        if right_child.left != self.NIL_LEAF:
-            right_child.left.parent = node
+        right_child.left.parent = node  # No NIL check: NIL_LEAF.parent is scratch
         right_child.parent = node.parent
         if node.parent is None:
             self.root = right_child
-        elif node == node.parent.left:
+        elif node is node.parent.left:
             node.parent.left = right_child
         else:
             node.parent.right = right_child
@@ -31,12 +74,11 @@ class RedBlackTree:
     def rotate_right(self, node):
         left_child = node.left
         node.left = left_child.right
-        if left_child.right != self.NIL_LEAF:
-            left_child.right.parent = node
+        left_child.right.parent = node  # No NIL check: NIL_LEAF.parent is scratch
         left_child.parent = node.parent
         if node.parent is None:
             self.root = left_child
-        elif node == node.parent.right:
+        elif node is node.parent.right:
             node.parent.right = left_child
         else:
             node.parent.left = left_child
@@ -44,52 +86,44 @@ class RedBlackTree:
         node.parent = left_child
 
     def fix_insert(self, node):
-        while node != self.root and node.parent.color == 'RED':
-            if node.parent == node.parent.parent.left:
-                uncle = node.parent.parent.right
-                if uncle.color == 'RED':
-                    node.parent.color = 'BLACK'
-                    uncle.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    node = node.parent.parent
+        while node is not self.root and node.parent.color == RED:
+            parent = node.parent
+            grand = parent.parent
+            if parent is grand.left:
+                uncle = grand.right
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
                 else:
-                    if node == node.parent.right:
-                        node = node.parent
+                    if node is parent.right:
+                        node = parent
                         self.rotate_left(node)
-                    node.parent.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    self.rotate_right(node.parent.parent)
+                        parent = node.parent  # The rotation moved node below its old child
+                    parent.color = BLACK
+                    grand.color = RED
+                    self.rotate_right(grand)
             else:
-                uncle = node.parent.parent.left
-                if uncle.color == 'RED':
-                    node.parent.color = 'BLACK'
-                    uncle.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    node = node.parent.parent
+                uncle = grand.left
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
                 else:
-                    if node == node.parent.left:
-                        node = node.parent
+                    if node is parent.left:
+                        node = parent
                         self.rotate_right(node)
-                    node.parent.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    self.rotate_left(node.parent.parent)
-        self.root.color = 'BLACK'
+                        parent = node.parent  # The rotation moved node below its old child
+                    parent.color = BLACK
+                    grand.color = RED
+                    self.rotate_left(grand)
+        self.root.color = BLACK
 
     def insert(self, data):
-        new_node = Node(data)
-        new_node.left = self.NIL_LEAF
-        new_node.right = self.NIL_LEAF
-
-        parent = None
-        current = self.root
-
-        while current != self.NIL_LEAF:
-            parent = current
-            if new_node.data < current.data:
-                current = current.left
-            else:
-                current = current.right
-
+        new_node = self._new_node(data)
+        parent = self._descend(self.root, data)
         new_node.parent = parent
 
         if parent is None:
@@ -99,14 +133,128 @@ class RedBlackTree:
         else:
             parent.right = new_node
 
-        new_node.color = 'RED'
+        new_node.color = RED
         self.fix_insert(new_node)
 
-    def inorder_traversal(self, node):
-        if node != self.NIL_LEAF:
-            self.inorder_traversal(node.left)
-            print(f'{node.data} ({node.color})', end=' ')
-            self.inorder_traversal(node.right)
+    def minimum(self, node):
+        while node.left is not self.NIL_LEAF:
+            node = node.left
+        return node
+
+    def transplant(self, u, v):
+        # Put the subtree rooted at v where the subtree rooted at u was
+        if u.parent is None:
+            self.root = v
+        elif u is u.parent.left:
+            u.parent.left = v
+        else:
+            u.parent.right = v
+        v.parent = u.parent  # Set even when v is NIL_LEAF: fix_delete reads it from there
+
+    def fix_delete(self, node):
+        while node is not self.root and node.color == BLACK:
+            # Read the parent once per pass: node may be NIL_LEAF, whose parent rotations overwrite
+            parent = node.parent
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self.rotate_left(parent)
+                    sibling = parent.right
+                if sibling.left.color == BLACK and sibling.right.color == BLACK:
+                    sibling.color = RED
+                    node = parent
+                else:
+                    if sibling.right.color == BLACK:
+                        sibling.left.color = BLACK
+                        sibling.color = RED
+                        self.rotate_right(sibling)
+                        sibling = parent.right
+                    sibling.color = parent.color
+                    parent.color = BLACK
+                    sibling.right.color = BLACK
+                    self.rotate_left(parent)
+                    node = self.root
+            else:
+                sibling = parent.left
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self.rotate_right(parent)
+                    sibling = parent.left
+                if sibling.right.color == BLACK and sibling.left.color == BLACK:
+                    sibling.color = RED
+                    node = parent
+                else:
+                    if sibling.left.color == BLACK:
+                        sibling.right.color = BLACK
+                        sibling.color = RED
+                        self.rotate_left(sibling)
+                        sibling = parent.left
+                    sibling.color = parent.color
+                    parent.color = BLACK
+                    sibling.left.color = BLACK
+                    self.rotate_right(parent)
+                    node = self.root
+        node.color = BLACK
+
+    def delete(self, data):
+        z = self.root
+        while z is not self.NIL_LEAF and z.data != data:
+            if data < z.data:
+                z = z.left
+            else:
+                z = z.right
+        if z is self.NIL_LEAF:
+            return False  # Not in the tree
+
+        # y is the node that leaves its position: z itself, or z's successor when z has two children
+        if z.left is self.NIL_LEAF or z.right is self.NIL_LEAF:
+            y = z
+        else:
+            y = self.minimum(z.right)
+        y_original_color = y.color
+
+        if z.left is self.NIL_LEAF:
+            x = z.right
+            self.transplant(z, z.right)
+        elif z.right is self.NIL_LEAF:
+            x = z.left
+            self.transplant(z, z.left)
+        else:
+            x = y.right
+            if y.parent is z:
+                x.parent = y  # Set even when x is NIL_LEAF: fix_delete reads it from there
+            else:
+                self.transplant(y, y.right)
+                y.right = z.right
+                y.right.parent = y
+            self.transplant(z, y)
+            y.left = z.left
+            y.left.parent = y
+            y.color = z.color
+
+        if y_original_color == BLACK:
+            self.fix_delete(x)
+        self._recycle(z)  # Hand the node back to the pool for the next insert
+        return True
+
+    def inorder_traversal(self, node, out=None):
+        # Collect one string per node and print them in a single call; pass a list as out to
+        # receive the strings instead
+        parts = [] if out is None else out
+        stack = []
+        current = node
+        while stack or current is not self.NIL_LEAF:
+            while current is not self.NIL_LEAF:
+                stack.append(current)
+                current = current.left
+            node = stack.pop()
+            parts.append(f'{node.data} ({"RED" if node.color == RED else "BLACK"})')
+            current = node.right
+        if out is None:
+            print(' '.join(parts), end=' ')
 
 # Example usage of the RedBlackTree class:
 if __name__ == '__main__':
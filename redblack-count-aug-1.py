@@ -1,48 +1,74 @@
 #	1.	Subtree Node Count Augmentation: Each node will track how many nodes exist 
 #       in the subtree rooted at that node, including itself.
-#	2.	Update Count During Insert and Rotation: Each time we insert a node or perform a rotation, 
-#       we will update the subtree node counts for the affected nodes.
+#	2.	Update Count During Insert and Rotation: While descending to the insertion point we add one
+#       to the count of every node we pass; each rotation then recomputes the two nodes it moved.
 #	3.	Subtree Count Formula: The count at each node is 1 + left_subtree_count + right_subtree_count.
 
+from collections import deque
+
 import matplotlib.pyplot as plt
 import networkx as nx
 from networkx.drawing.nx_pydot import graphviz_layout
 
+DEBUG = False  # Set to True to trace inserts, rotations and augmentation updates
+
+RED = 0
+BLACK = 1
+_VIZ_COLOR = ('red', 'black')  # Drawing color for RED and BLACK, indexed by node.color
+
 class Node:
+    __slots__ = ('data', 'color', 'left', 'right', 'parent', 'subtree_count')
+
     def __init__(self, data, NIL_LEAF=None):
         self.data = data
-        self.color = 'RED'  # New nodes are always red
+        self.color = RED  # New nodes are always red
         self.left = NIL_LEAF  # Assign NIL_LEAF instead of None
         self.right = NIL_LEAF  # Assign NIL_LEAF instead of None
         self.parent = None
         self.subtree_count = 1  # Track the number of nodes in the subtree (including this node)
 
-        # Debugging the node creation
-        print(f"Created node {self.data} with left: {self.left} and right: {self.right}")
-
 class RedBlackTree:
     def __init__(self):
-        # Step 1: Create the NIL_LEAF node with None for left and right
+        # Create the NIL_LEAF node. Its left and right stay None: every walk stops at NIL_LEAF,
+        # so nothing reads them, and pointing them back at NIL_LEAF would only add a reference cycle
         self.NIL_LEAF = Node(None)
-        # Step 2: Set the NIL_LEAF's left and right to itself after creation
-        self.NIL_LEAF.color = 'BLACK'
-        self.NIL_LEAF.left = self.NIL_LEAF
-        self.NIL_LEAF.right = self.NIL_LEAF
+        self.NIL_LEAF.color = BLACK
         self.NIL_LEAF.subtree_count = 0  # NIL nodes have a subtree count of 0
+        # NIL_LEAF.parent is scratch space: rotations may overwrite it, and only delete reads it,
+        # right after setting it
         self.root = self.NIL_LEAF
+        self._version = 0  # Bumped on every structural change
+        self._viz_cache = (-1, None, None, None)  # (version, G, pos, labels) of the last visualize()
+        self._node_pool = []  # Nodes released by _recycle, ready for reuse
+
+        if DEBUG:
+            print(f"Initialized NIL_LEAF: {self.NIL_LEAF}")
 
-        print(f"Initialized NIL_LEAF: {self.NIL_LEAF}")
+    def _new_node(self, data):
+        # Reuse a node handed back by _recycle before allocating a fresh one
+        if not self._node_pool:
+            return Node(data, self.NIL_LEAF)
+        node = self._node_pool.pop()
+        node.__init__(data, self.NIL_LEAF)
+        return node
+
+    def _recycle(self, node):
+        # Drop the node's links so it keeps nothing alive while it sits in the pool
+        node.data = None
+        node.left = node.right = node.parent = None
+        self._node_pool.append(node)
 
     def rotate_left(self, node):
-        print(f"Rotate left on node {node.data}")
+        self._version += 1
+        if DEBUG:
+            print(f"Rotate left on node {node.data}")
         right_child = node.right
         node.right = right_child.left
-        if right_child.left != self.NIL_LEAF:
-            right_child.left.parent = node
+        right_child.left.parent = node  # No NIL check: NIL_LEAF.parent is scratch
         right_child.parent = node.parent
         if node.parent is None:
             self.root = right_child
-        elif node == node.parent.left:
+        elif node is node.parent.left:
             node.parent.left = right_child
         else:
             node.parent.right = right_child
@@ -54,15 +80,16 @@ class RedBlackTree:
         self.update_subtree_count(right_child)
 
     def rotate_right(self, node):
-        print(f"Rotate right on node {node.data}")
+        self._version += 1
+        if DEBUG:
+            print(f"Rotate right on node {node.data}")
         left_child = node.left
         node.left = left_child.right
-        if left_child.right != self.NIL_LEAF:
-            left_child.right.parent = node
+        left_child.right.parent = node  # No NIL check: NIL_LEAF.parent is scratch
         left_child.parent = node.parent
         if node.parent is None:
             self.root = left_child
-        elif node == node.parent.right:
+        elif node is node.parent.right:
             node.parent.right = left_child
         else:
             node.parent.left = left_child
@@ -74,51 +101,59 @@ class RedBlackTree:
         self.update_subtree_count(left_child)
 
     def fix_insert(self, node):
-        print(f"Fixing insert on node {node.data}")
-        while node != self.root and node.parent.color == 'RED':
-            if node.parent == node.parent.parent.left:
-                uncle = node.parent.parent.right
-                if uncle.color == 'RED':
-                    node.parent.color = 'BLACK'
-                    uncle.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    node = node.parent.parent
+        if DEBUG:
+            print(f"Fixing insert on node {node.data}")
+        while node is not self.root and node.parent.color == RED:
+            parent = node.parent
+            grand = parent.parent
+            if parent is grand.left:
+                uncle = grand.right
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
                 else:
-                    if node == node.parent.right:
-                        node = node.parent
+                    if node is parent.right:
+                        node = parent
                         self.rotate_left(node)
-                    node.parent.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    self.rotate_right(node.parent.parent)
+                        parent = node.parent  # The rotation moved node below its old child
+                    parent.color = BLACK
+                    grand.color = RED
+                    self.rotate_right(grand)
             else:
-                uncle = node.parent.parent.left
-                if uncle.color == 'RED':
-                    node.parent.color = 'BLACK'
-                    uncle.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    node = node.parent.parent
+                uncle = grand.left
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
                 else:
-                    if node == node.parent.left:
-                        node = node.parent
+                    if node is parent.left:
+                        node = parent
                         self.rotate_right(node)
-                    node.parent.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    self.rotate_left(node.parent.parent)
-        self.root.color = 'BLACK'
+                        parent = node.parent  # The rotation moved node below its old child
+                    parent.color = BLACK
+                    grand.color = RED
+                    self.rotate_left(grand)
+        self.root.color = BLACK
 
     def insert(self, data):
-        print(f"Inserting {data}")
-        new_node = Node(data, self.NIL_LEAF)  # Create a new node with NIL_LEAF as children
+        self._version += 1
+        if DEBUG:
+            print(f"Inserting {data}")
+        new_node = self._new_node(data)  # Create a new node with NIL_LEAF as children
 
         parent = None
         current = self.root
 
         # Debug: Check root initialization
-        if current is None:
+        if DEBUG and current is None:
             raise RuntimeError("Root is None, should be NIL_LEAF")
 
-        while current != self.NIL_LEAF:
+        while current is not self.NIL_LEAF:
             parent = current
+            current.subtree_count += 1  # The new node will land in this subtree
             if new_node.data < current.data:
                 current = current.left
             else:
@@ -133,57 +168,180 @@ class RedBlackTree:
         else:
             parent.right = new_node
 
-        new_node.color = 'RED'
+        new_node.color = RED
         self.fix_insert(new_node)
 
-        # Update subtree count from the inserted node upwards
-        print(f"Calling update_subtree_count_upwards for node {new_node.data}")
-        self.update_subtree_count_upwards(new_node)
+    def minimum(self, node):
+        while node.left is not self.NIL_LEAF:
+            node = node.left
+        return node
+
+    def transplant(self, u, v):
+        # Put the subtree rooted at v where the subtree rooted at u was
+        if u.parent is None:
+            self.root = v
+        elif u is u.parent.left:
+            u.parent.left = v
+        else:
+            u.parent.right = v
+        v.parent = u.parent  # Set even when v is NIL_LEAF: fix_delete reads it from there
+
+    def fix_delete(self, node):
+        if DEBUG:
+            print(f"Fixing delete on node {node.data}")
+        while node is not self.root and node.color == BLACK:
+            # Read the parent once per pass: node may be NIL_LEAF, whose parent rotations overwrite
+            parent = node.parent
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self.rotate_left(parent)
+                    sibling = parent.right
+                if sibling.left.color == BLACK and sibling.right.color == BLACK:
+                    sibling.color = RED
+                    node = parent
+                else:
+                    if sibling.right.color == BLACK:
+                        sibling.left.color = BLACK
+                        sibling.color = RED
+                        self.rotate_right(sibling)
+                        sibling = parent.right
+                    sibling.color = parent.color
+                    parent.color = BLACK
+                    sibling.right.color = BLACK
+                    self.rotate_left(parent)
+                    node = self.root
+            else:
+                sibling = parent.left
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self.rotate_right(parent)
+                    sibling = parent.left
+                if sibling.right.color == BLACK and sibling.left.color == BLACK:
+                    sibling.color = RED
+                    node = parent
+                else:
+                    if sibling.left.color == BLACK:
+                        sibling.right.color = BLACK
+                        sibling.color = RED
+                        self.rotate_left(sibling)
+                        sibling = parent.left
+                    sibling.color = parent.color
+                    parent.color = BLACK
+                    sibling.left.color = BLACK
+                    self.rotate_right(parent)
+                    node = self.root
+        node.color = BLACK
+
+    def delete(self, data):
+        if DEBUG:
+            print(f"Deleting {data}")
+        z = self.root
+        while z is not self.NIL_LEAF and z.data != data:
+            if data < z.data:
+                z = z.left
+            else:
+                z = z.right
+        if z is self.NIL_LEAF:
+            return False  # Not in the tree
+        self._version += 1
+
+        # y is the node that leaves its position: z itself, or z's successor when z has two children
+        if z.left is self.NIL_LEAF or z.right is self.NIL_LEAF:
+            y = z
+        else:
+            y = self.minimum(z.right)
+        y_original_color = y.color
+
+        # Every ancestor of the position y leaves loses one node from its subtree
+        ancestor = y.parent
+        while ancestor is not None:
+            ancestor.subtree_count -= 1
+            ancestor = ancestor.parent
+
+        if z.left is self.NIL_LEAF:
+            x = z.right
+            self.transplant(z, z.right)
+        elif z.right is self.NIL_LEAF:
+            x = z.left
+            self.transplant(z, z.left)
+        else:
+            x = y.right
+            if y.parent is z:
+                x.parent = y  # Set even when x is NIL_LEAF: fix_delete reads it from there
+            else:
+                self.transplant(y, y.right)
+                y.right = z.right
+                y.right.parent = y
+            self.transplant(z, y)
+            y.left = z.left
+            y.left.parent = y
+            y.color = z.color
+            y.subtree_count = z.subtree_count  # Already one less, from the walk above
+
+        if y_original_color == BLACK:
+            self.fix_delete(x)
+        self._recycle(z)  # Hand the node back to the pool for the next insert
+        return True
 
     def update_subtree_count(self, node):
-        if node == self.NIL_LEAF:
+        if node is self.NIL_LEAF:
             return
 
         # Subtree count is 1 (itself) + left subtree count + right subtree count
         node.subtree_count = 1 + node.left.subtree_count + node.right.subtree_count
-        print(f"Updated node count for node {node.data}: {node.subtree_count}")
-
-    def update_subtree_count_upwards(self, node):
-        while node != self.NIL_LEAF:
-            if node is None:
-                raise RuntimeError("update_subtree_count_upwards() called on None node!")
-            print(f"Updating count for node {node.data}")
-            self.update_subtree_count(node)
-            if node.parent is None:  # Stop at root node
-                break
-            node = node.parent
-
-    def inorder_traversal(self, node):
-        if node != self.NIL_LEAF:
-            self.inorder_traversal(node.left)
-            print(f'{node.data} ({node.color}, count={node.subtree_count})', end=' ')
-            self.inorder_traversal(node.right)
+        if DEBUG:
+            print(f"Updated node count for node {node.data}: {node.subtree_count}")
+
+    def inorder_traversal(self, node, out=None):
+        # Collect one string per node and print them in a single call; pass a list as out to
+        # receive the strings instead
+        parts = [] if out is None else out
+        stack = []
+        current = node
+        while stack or current is not self.NIL_LEAF:
+            while current is not self.NIL_LEAF:
+                stack.append(current)
+                current = current.left
+            node = stack.pop()
+            parts.append(f'{node.data} ({"RED" if node.color == RED else "BLACK"}, count={node.subtree_count})')
+            current = node.right
+        if out is None:
+            print(' '.join(parts), end=' ')
 
     def visualize(self):
-        G = nx.DiGraph()
-        labels = {}
-        self._build_visual(self.root, G, labels)
-        pos = graphviz_layout(G, prog="dot")  # Tree-like layout using pydot and graphviz
+        version, G, pos, labels = self._viz_cache
+        if version != self._version:
+            # The tree changed since the last call, so rebuild the graph and its layout
+            G = nx.DiGraph()
+            labels = {}
+            self._build_visual(self.root, G, labels)
+            pos = graphviz_layout(G, prog="dot")  # Tree-like layout using pydot and graphviz
+            self._viz_cache = (self._version, G, pos, labels)
         colors = [G.nodes[n]['color'] for n in G.nodes]
         nx.draw(G, pos, labels=labels, node_color=colors, with_labels=True, node_size=5000, font_size=10, font_color='white')
         plt.show()
 
     def _build_visual(self, node, G, labels):
-        if node != self.NIL_LEAF:
+        nodes_data = []
+        edges = []
+        queue = deque([node] if node is not self.NIL_LEAF else [])
+        while queue:
+            node = queue.popleft()
             # Label includes both the data and count of nodes in its subtree
-            G.add_node(node.data, color='red' if node.color == 'RED' else 'black')
+            nodes_data.append((node.data, {'color': _VIZ_COLOR[node.color]}))
             labels[node.data] = f'{node.data} (count={node.subtree_count})'
-            if node.left != self.NIL_LEAF:
-                G.add_edge(node.data, node.left.data)
-            if node.right != self.NIL_LEAF:
-                G.add_edge(node.data, node.right.data)
-            self._build_visual(node.left, G, labels)
-            self._build_visual(node.right, G, labels)
+            if node.left is not self.NIL_LEAF:
+                edges.append((node.data, node.left.data))
+                queue.append(node.left)
+            if node.right is not self.NIL_LEAF:
+                edges.append((node.data, node.right.data))
+                queue.append(node.right)
+        G.add_nodes_from(nodes_data)
+        G.add_edges_from(edges)
 
 # Example usage of the RedBlackTree class:
 if __name__ == '__main__':
@@ -0,0 +1,264 @@
+#	1.	Same tree as redblack-count-aug-1.py, but with no Node objects: every field lives in its own
+#       NumPy array (structure of arrays) and a node is just an integer index into those arrays.
+#	2.	Index 0 is the NIL leaf, so "node.left" becomes left[node] and a NIL check is left[node] == NIL.
+#	3.	The arrays start small and double in size whenever they fill up.
+#	4.	Rotations, the insert fix-up and the BST descent are free functions over the arrays. When Numba
+#       is installed they are compiled with @njit; otherwise they run as ordinary Python.
+
+from collections import deque
+
+import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
+from networkx.drawing.nx_pydot import graphviz_layout
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional: without it the same functions run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+RED = 0
+BLACK = 1
+_VIZ_COLOR = ('red', 'black')  # Drawing color for RED and BLACK, indexed by node.color
+
+NIL = 0  # Index of the shared NIL leaf
+
+
+# The tree operations are free functions over the arrays so Numba can compile them.
+# Each one takes the current root and returns the (possibly new) root.
+
+@njit(cache=True)
+def _update_subtree_count(left, right, count, node):
+    if node == NIL:
+        return
+
+    # Subtree count is 1 (itself) + left subtree count + right subtree count
+    count[node] = 1 + count[left[node]] + count[right[node]]
+
+
+@njit(cache=True)
+def _rotate_left(left, right, parent, count, root, node):
+    right_child = right[node]
+    right[node] = left[right_child]
+    parent[left[right_child]] = node  # No NIL check: parent[NIL] is scratch
+    parent[right_child] = parent[node]
+    if parent[node] == NIL:
+        root = right_child
+    elif node == left[parent[node]]:
+        left[parent[node]] = right_child
+    else:
+        right[parent[node]] = right_child
+    left[right_child] = node
+    parent[node] = right_child
+
+    # Update subtree counts after rotation
+    _update_subtree_count(left, right, count, node)
+    _update_subtree_count(left, right, count, right_child)
+    return root
+
+
+@njit(cache=True)
+def _rotate_right(left, right, parent, count, root, node):
+    left_child = left[node]
+    left[node] = right[left_child]
+    parent[right[left_child]] = node  # No NIL check: parent[NIL] is scratch
+    parent[left_child] = parent[node]
+    if parent[node] == NIL:
+        root = left_child
+    elif node == right[parent[node]]:
+        right[parent[node]] = left_child
+    else:
+        left[parent[node]] = left_child
+    right[left_child] = node
+    parent[node] = left_child
+
+    # Update subtree counts after rotation
+    _update_subtree_count(left, right, count, node)
+    _update_subtree_count(left, right, count, left_child)
+    return root
+
+
+@njit(cache=True)
+def _fix_insert(left, right, parent, color, count, root, node):
+    while node != root and color[parent[node]] == RED:
+        p = parent[node]
+        grand = parent[p]
+        if p == left[grand]:
+            uncle = right[grand]
+            if color[uncle] == RED:
+                color[p] = BLACK
+                color[uncle] = BLACK
+                color[grand] = RED
+                node = grand
+            else:
+                if node == right[p]:
+                    node = p
+                    root = _rotate_left(left, right, parent, count, root, node)
+                    p = parent[node]  # The rotation moved node below its old child
+                color[p] = BLACK
+                color[grand] = RED
+                root = _rotate_right(left, right, parent, count, root, grand)
+        else:
+            uncle = left[grand]
+            if color[uncle] == RED:
+                color[p] = BLACK
+                color[uncle] = BLACK
+                color[grand] = RED
+                node = grand
+            else:
+                if node == left[p]:
+                    node = p
+                    root = _rotate_right(left, right, parent, count, root, node)
+                    p = parent[node]  # The rotation moved node below its old child
+                color[p] = BLACK
+                color[grand] = RED
+                root = _rotate_left(left, right, parent, count, root, grand)
+    color[root] = BLACK
+    return root
+
+
+@njit(cache=True)
+def _bst_insert(keys, left, right, parent, count, root, node):
+    # Plain BST descent that links node under its parent and bumps the counts on the way down
+    data = keys[node]
+    p = NIL
+    current = root
+    while current != NIL:
+        p = current
+        count[current] += 1  # The new node will land in this subtree
+        if data < keys[current]:
+            current = left[current]
+        else:
+            current = right[current]
+
+    parent[node] = p
+
+    if p == NIL:
+        root = node
+    elif data < keys[p]:
+        left[p] = node
+    else:
+        right[p] = node
+    return root
+
+
+class RedBlackTree:
+    def __init__(self, capacity=16):
+        self.data = np.empty(capacity, dtype=np.int64)
+        self.color = np.empty(capacity, dtype=np.uint8)
+        self.left = np.empty(capacity, dtype=np.int32)
+        self.right = np.empty(capacity, dtype=np.int32)
+        self.parent = np.empty(capacity, dtype=np.int32)
+        self.subtree_count = np.empty(capacity, dtype=np.int32)
+
+        # Slot 0 is the NIL leaf: black, linked to itself, with a subtree count of 0.
+        # parent[NIL] is scratch space: rotations may overwrite it and nothing reads it.
+        self.color[NIL] = BLACK
+        self.left[NIL] = self.right[NIL] = self.parent[NIL] = NIL
+        self.subtree_count[NIL] = 0
+
+        self.size = 1  # Next free slot
+        self.root = NIL
+        self._version = 0  # Bumped on every structural change
+        self._viz_cache = (-1, None, None, None)  # (version, G, pos, labels) of the last visualize()
+
+    def _grow(self):
+        # Double every array, keeping the slots already in use
+        capacity = 2 * len(self.data)
+        for name in ('data', 'color', 'left', 'right', 'parent', 'subtree_count'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def rotate_left(self, node):
+        self._version += 1
+        self.root = _rotate_left(self.left, self.right, self.parent, self.subtree_count, self.root, node)
+
+    def rotate_right(self, node):
+        self._version += 1
+        self.root = _rotate_right(self.left, self.right, self.parent, self.subtree_count, self.root, node)
+
+    def fix_insert(self, node):
+        self.root = _fix_insert(self.left, self.right, self.parent, self.color, self.subtree_count, self.root, node)
+
+    def insert(self, data):
+        self._version += 1
+        if self.size == len(self.data):
+            self._grow()
+        new_node = self.size
+        self.size += 1
+
+        self.data[new_node] = data
+        self.color[new_node] = RED  # New nodes are always red
+        self.left[new_node] = self.right[new_node] = NIL
+        self.subtree_count[new_node] = 1
+
+        self.root = _bst_insert(self.data, self.left, self.right, self.parent, self.subtree_count, self.root, new_node)
+        self.fix_insert(new_node)
+
+    def update_subtree_count(self, node):
+        _update_subtree_count(self.left, self.right, self.subtree_count, node)
+
+    def inorder_traversal(self, node, out=None):
+        # Collect one string per node and print them in a single call; pass a list as out to
+        # receive the strings instead
+        parts = [] if out is None else out
+        stack = []
+        current = node
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = self.left[current]
+            node = stack.pop()
+            parts.append(f'{self.data[node]} ({"RED" if self.color[node] == RED else "BLACK"}, count={self.subtree_count[node]})')
+            current = self.right[node]
+        if out is None:
+            print(' '.join(parts), end=' ')
+
+    def visualize(self):
+        version, G, pos, labels = self._viz_cache
+        if version != self._version:
+            # The tree changed since the last call, so rebuild the graph and its layout
+            G = nx.DiGraph()
+            labels = {}
+            self._build_visual(self.root, G, labels)
+            pos = graphviz_layout(G, prog="dot")  # Tree-like layout using pydot and graphviz
+            self._viz_cache = (self._version, G, pos, labels)
+        colors = [G.nodes[n]['color'] for n in G.nodes]
+        nx.draw(G, pos, labels=labels, node_color=colors, with_labels=True, node_size=5000, font_size=10, font_color='white')
+        plt.show()
+
+    def _build_visual(self, node, G, labels):
+        keys, left, right = self.data, self.left, self.right
+        nodes_data = []
+        edges = []
+        queue = deque([node] if node != NIL else [])
+        while queue:
+            node = queue.popleft()
+            key = int(keys[node])
+            # Label includes both the data and count of nodes in its subtree
+            nodes_data.append((key, {'color': _VIZ_COLOR[self.color[node]]}))
+            labels[key] = f'{key} (count={self.subtree_count[node]})'
+            if left[node] != NIL:
+                edges.append((key, int(keys[left[node]])))
+                queue.append(left[node])
+            if right[node] != NIL:
+                edges.append((key, int(keys[right[node]])))
+                queue.append(right[node])
+        G.add_nodes_from(nodes_data)
+        G.add_edges_from(edges)
+
+# Example usage of the RedBlackTree class:
+if __name__ == '__main__':
+    tree = RedBlackTree()
+    elements = [400, 20, 15, 25, 10, 5, 1, 17, 22, 27,8,99,101,7,2,33,34,35,103,77,78,79]
+
+    for element in elements:
+        tree.insert(element)
+
+    print("Inorder traversal of the Red-Black Tree:")
+    tree.inorder_traversal(tree.root)
+    print("\nVisualizing Red-Black Tree with Subtree Count Information:")
+    tree.visualize()
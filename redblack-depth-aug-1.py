@@ -1,11 +1,19 @@
+from collections import deque
+
 import matplotlib.pyplot as plt
 import networkx as nx
 from networkx.drawing.nx_pydot import graphviz_layout
 
+RED = 0
+BLACK = 1
+_VIZ_COLOR = ('red', 'black')  # Drawing color for RED and BLACK, indexed by node.color
+
 class Node:
+    __slots__ = ('data', 'color', 'left', 'right', 'parent', 'depth')
+
     def __init__(self, data, depth=0):
         self.data = data
-        self.color = 'RED'  # New nodes are always red
+        self.color = RED  # New nodes are always red
         self.left = None
         self.right = None
         self.parent = None
@@ -14,18 +22,21 @@ class Node:
 class RedBlackTree:
     def __init__(self):
         self.NIL_LEAF = Node(None)
-        self.NIL_LEAF.color = 'BLACK'
+        self.NIL_LEAF.color = BLACK
+        # NIL_LEAF.parent is scratch space: rotations may overwrite it and nothing reads it
         self.root = self.NIL_LEAF
+        self._version = 0  # Bumped on every structural change
+        self._viz_cache = (-1, None, None, None)  # (version, G, pos, labels) of the last visualize()
 
     def rotate_left(self, node):
+        self._version += 1
         right_child = node.right
         node.right = right_child.left
-        if right_child.left != self.NIL_LEAF:
-            right_child.left.parent = node
+        right_child.left.parent = node  # No NIL check: NIL_LEAF.parent is scratch
         right_child.parent = node.parent
         if node.parent is None:
             self.root = right_child
-        elif node == node.parent.left:
+        elif node is node.parent.left:
             node.parent.left = right_child
         else:
             node.parent.right = right_child
@@ -37,14 +48,14 @@ class RedBlackTree:
         node.depth += 1
 
     def rotate_right(self, node):
+        self._version += 1
         left_child = node.left
         node.left = left_child.right
-        if left_child.right != self.NIL_LEAF:
-            left_child.right.parent = node
+        left_child.right.parent = node  # No NIL check: NIL_LEAF.parent is scratch
         left_child.parent = node.parent
         if node.parent is None:
             self.root = left_child
-        elif node == node.parent.right:
+        elif node is node.parent.right:
             node.parent.right = left_child
         else:
             node.parent.left = left_child
@@ -56,38 +67,43 @@ class RedBlackTree:
         node.depth += 1
 
     def fix_insert(self, node):
-        while node != self.root and node.parent.color == 'RED':
-            if node.parent == node.parent.parent.left:
-                uncle = node.parent.parent.right
-                if uncle.color == 'RED':
-                    node.parent.color = 'BLACK'
-                    uncle.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    node = node.parent.parent
+        while node is not self.root and node.parent.color == RED:
+            parent = node.parent
+            grand = parent.parent
+            if parent is grand.left:
+                uncle = grand.right
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
                 else:
-                    if node == node.parent.right:
-                        node = node.parent
+                    if node is parent.right:
+                        node = parent
                         self.rotate_left(node)
-                    node.parent.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    self.rotate_right(node.parent.parent)
+                        parent = node.parent  # The rotation moved node below its old child
+                    parent.color = BLACK
+                    grand.color = RED
+                    self.rotate_right(grand)
             else:
-                uncle = node.parent.parent.left
-                if uncle.color == 'RED':
-                    node.parent.color = 'BLACK'
-                    uncle.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    node = node.parent.parent
+                uncle = grand.left
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
                 else:
-                    if node == node.parent.left:
-                        node = node.parent
+                    if node is parent.left:
+                        node = parent
                         self.rotate_right(node)
-                    node.parent.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    self.rotate_left(node.parent.parent)
-        self.root.color = 'BLACK'
+                        parent = node.parent  # The rotation moved node below its old child
+                    parent.color = BLACK
+                    grand.color = RED
+                    self.rotate_left(grand)
+        self.root.color = BLACK
 
     def insert(self, data):
+        self._version += 1
         new_node = Node(data)
         new_node.left = self.NIL_LEAF
         new_node.right = self.NIL_LEAF
@@ -96,7 +112,7 @@ class RedBlackTree:
         current = self.root
         depth = 0  # Keep track of the depth of the current node
 
-        while current != self.NIL_LEAF:
+        while current is not self.NIL_LEAF:
             parent = current
             depth += 1  # Increment depth as we move down the tree
             if new_node.data < current.data:
@@ -114,35 +130,55 @@ class RedBlackTree:
         else:
             parent.right = new_node
 
-        new_node.color = 'RED'
+        new_node.color = RED
         self.fix_insert(new_node)
 
-    def inorder_traversal(self, node):
-        if node != self.NIL_LEAF:
-            self.inorder_traversal(node.left)
-            print(f'{node.data} ({node.color}, depth={node.depth})', end=' ')
-            self.inorder_traversal(node.right)
+    def inorder_traversal(self, node, out=None):
+        # Collect one string per node and print them in a single call; pass a list as out to
+        # receive the strings instead
+        parts = [] if out is None else out
+        stack = []
+        current = node
+        while stack or current is not self.NIL_LEAF:
+            while current is not self.NIL_LEAF:
+                stack.append(current)
+                current = current.left
+            node = stack.pop()
+            parts.append(f'{node.data} ({"RED" if node.color == RED else "BLACK"}, depth={node.depth})')
+            current = node.right
+        if out is None:
+            print(' '.join(parts), end=' ')
 
     def visualize(self):
-        G = nx.DiGraph()
-        labels = {}
-        self._build_visual(self.root, G, labels)
-        pos = graphviz_layout(G, prog="dot")  # Tree-like layout using pydot and graphviz
+        version, G, pos, labels = self._viz_cache
+        if version != self._version:
+            # The tree changed since the last call, so rebuild the graph and its layout
+            G = nx.DiGraph()
+            labels = {}
+            self._build_visual(self.root, G, labels)
+            pos = graphviz_layout(G, prog="dot")  # Tree-like layout using pydot and graphviz
+            self._viz_cache = (self._version, G, pos, labels)
         colors = [G.nodes[n]['color'] for n in G.nodes]
         nx.draw(G, pos, labels=labels, node_color=colors, with_labels=True, node_size=1500, font_size=10, font_color='white')
         plt.show()
 
     def _build_visual(self, node, G, labels):
-        if node != self.NIL_LEAF:
+        nodes_data = []
+        edges = []
+        queue = deque([node] if node is not self.NIL_LEAF else [])
+        while queue:
+            node = queue.popleft()
             # Label includes both the data and depth
-            G.add_node(node.data, color='red' if node.color == 'RED' else 'black')
+            nodes_data.append((node.data, {'color': _VIZ_COLOR[node.color]}))
             labels[node.data] = f'{node.data} (d={node.depth})'
-            if node.left != self.NIL_LEAF:
-                G.add_edge(node.data, node.left.data)
-            if node.right != self.NIL_LEAF:
-                G.add_edge(node.data, node.right.data)
-            self._build_visual(node.left, G, labels)
-            self._build_visual(node.right, G, labels)
+            if node.left is not self.NIL_LEAF:
+                edges.append((node.data, node.left.data))
+                queue.append(node.left)
+            if node.right is not self.NIL_LEAF:
+                edges.append((node.data, node.right.data))
+                queue.append(node.right)
+        G.add_nodes_from(nodes_data)
+        G.add_edges_from(edges)
 
 # Example usage of the RedBlackTree class:
 if __name__ == '__main__':
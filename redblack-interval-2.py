@@ -0,0 +1,458 @@
+#	1.	Same interval tree as redblack-interval.py, but with no IntervalNode objects: every field lives in
+#       its own NumPy array (structure of arrays) and a node is just an integer index into those arrays.
+#	2.	Index 0 is the NIL leaf, so "node.left" becomes left[node] and a NIL check is left[node] == NIL.
+#       max_end[NIL] is -inf, so max(hi[node], max_end[left[node]], max_end[right[node]]) needs no NIL checks.
+#	3.	Endpoints are float64 by default so the NIL leaf can hold -inf. For integer data pass dtype=np.int64:
+#       the NIL leaf then holds the smallest int64 instead, and inserting a non-integer endpoint raises
+#       ValueError rather than truncating it. Queries return plain Python tuples.
+#	4.	The arrays start small and double in size whenever they fill up.
+#	5.	Rotations, the insert fix-up, the BST descent and the max_end updates are free functions over the
+#       arrays. When Numba is installed they are compiled with @njit; otherwise they run as ordinary Python.
+
+from collections import deque
+
+import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
+from networkx.drawing.nx_pydot import graphviz_layout
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional: without it the same functions run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+RED = 0
+BLACK = 1
+_VIZ_COLOR = ('red', 'black')  # Drawing color for RED and BLACK, indexed by color[node]
+
+NIL = 0  # Index of the shared NIL leaf
+_FLAT_SCAN_MAX = 64  # Trees up to this size answer overlap_search_batch with one flat scan
+
+
+# The tree operations are free functions over the arrays so Numba can compile them.
+# Each one that can move the root takes the current root and returns the (possibly new) root.
+
+@njit(cache=True)
+def _update_max_endpoint(hi, max_end, left, right, node):
+    if node == NIL:
+        return
+
+    # Max endpoint is the maximum of the node's high end and the max_end of its children
+    max_end[node] = max(hi[node], max_end[left[node]], max_end[right[node]])
+
+
+@njit(cache=True)
+def _update_max_endpoint_upwards(hi, max_end, left, right, parent, node):
+    while node != NIL:
+        _update_max_endpoint(hi, max_end, left, right, node)
+        node = parent[node]  # parent[root] is NIL, which ends the walk
+
+
+@njit(cache=True)
+def _rotate_left(hi, max_end, left, right, parent, root, node):
+    right_child = right[node]
+    right[node] = left[right_child]
+    parent[left[right_child]] = node  # No NIL check: parent[NIL] is scratch
+    parent[right_child] = parent[node]
+    if parent[node] == NIL:
+        root = right_child
+    elif node == left[parent[node]]:
+        left[parent[node]] = right_child
+    else:
+        right[parent[node]] = right_child
+    left[right_child] = node
+    parent[node] = right_child
+
+    # Update max_end after rotation
+    _update_max_endpoint(hi, max_end, left, right, node)
+    _update_max_endpoint(hi, max_end, left, right, right_child)
+    return root
+
+
+@njit(cache=True)
+def _rotate_right(hi, max_end, left, right, parent, root, node):
+    left_child = left[node]
+    left[node] = right[left_child]
+    parent[right[left_child]] = node  # No NIL check: parent[NIL] is scratch
+    parent[left_child] = parent[node]
+    if parent[node] == NIL:
+        root = left_child
+    elif node == right[parent[node]]:
+        right[parent[node]] = left_child
+    else:
+        left[parent[node]] = left_child
+    right[left_child] = node
+    parent[node] = left_child
+
+    # Update max_end after rotation
+    _update_max_endpoint(hi, max_end, left, right, node)
+    _update_max_endpoint(hi, max_end, left, right, left_child)
+    return root
+
+
+@njit(cache=True)
+def _fix_insert(hi, max_end, left, right, parent, color, root, node):
+    while node != root and color[parent[node]] == RED:
+        p = parent[node]
+        grand = parent[p]
+        if p == left[grand]:
+            uncle = right[grand]
+            if color[uncle] == RED:
+                color[p] = BLACK
+                color[uncle] = BLACK
+                color[grand] = RED
+                node = grand
+            else:
+                if node == right[p]:
+                    node = p
+                    root = _rotate_left(hi, max_end, left, right, parent, root, node)
+                    p = parent[node]  # The rotation moved node below its old child
+                color[p] = BLACK
+                color[grand] = RED
+                root = _rotate_right(hi, max_end, left, right, parent, root, grand)
+        else:
+            uncle = left[grand]
+            if color[uncle] == RED:
+                color[p] = BLACK
+                color[uncle] = BLACK
+                color[grand] = RED
+                node = grand
+            else:
+                if node == left[p]:
+                    node = p
+                    root = _rotate_right(hi, max_end, left, right, parent, root, node)
+                    p = parent[node]  # The rotation moved node below its old child
+                color[p] = BLACK
+                color[grand] = RED
+                root = _rotate_left(hi, max_end, left, right, parent, root, grand)
+    color[root] = BLACK
+    return root
+
+
+@njit(cache=True)
+def _bst_insert(lo, left, right, parent, root, node):
+    # Plain BST descent that links node under its parent
+    low = lo[node]
+    p = NIL
+    current = root
+    while current != NIL:
+        p = current
+        if low < lo[current]:
+            current = left[current]
+        else:
+            current = right[current]
+
+    parent[node] = p
+
+    if p == NIL:
+        root = node
+    elif low < lo[p]:
+        left[p] = node
+    else:
+        right[p] = node
+    return root
+
+
+@njit(cache=True)
+def _build_balanced(hi, max_end, left, right, parent, color, n):
+    # Nodes 1..n already hold the intervals sorted by low end. Link them into a balanced BST by
+    # making the middle of each range its root, then fill max_end with children before parents.
+    root = NIL
+    if n == 0:
+        return root
+
+    # Every NIL child sits at depth floor(log2(n)) or one below, so coloring only the nodes at
+    # that depth red (never the root) gives every path the same number of black nodes
+    red_depth = 0
+    while (2 << red_depth) <= n:
+        red_depth += 1
+
+    order = np.empty(n, dtype=np.int64)  # Nodes in preorder: every parent before its children
+    stack = np.empty((n, 4), dtype=np.int64)  # Ranges still to link: (first, last, parent, depth)
+    stack[0, 0], stack[0, 1], stack[0, 2], stack[0, 3] = 1, n, NIL, 0
+    top = 1
+    count = 0
+    while top > 0:
+        top -= 1
+        first, last, p, depth = stack[top, 0], stack[top, 1], stack[top, 2], stack[top, 3]
+        node = (first + last) // 2
+        parent[node] = p
+        if p == NIL:
+            root = node
+        elif node < p:
+            left[p] = node
+        else:
+            right[p] = node
+        left[node] = right[node] = NIL
+        color[node] = RED if depth == red_depth and depth > 0 else BLACK
+        order[count] = node
+        count += 1
+        if first < node:
+            stack[top, 0], stack[top, 1], stack[top, 2], stack[top, 3] = first, node - 1, node, depth + 1
+            top += 1
+        if node < last:
+            stack[top, 0], stack[top, 1], stack[top, 2], stack[top, 3] = node + 1, last, node, depth + 1
+            top += 1
+
+    # Reversed preorder visits both children of a node before the node itself
+    for i in range(n - 1, -1, -1):
+        node = order[i]
+        max_end[node] = max(hi[node], max_end[left[node]], max_end[right[node]])
+    return root
+
+
+class IntervalTree:
+    def __init__(self, capacity=16, dtype=np.float64):
+        self.lo = np.empty(capacity, dtype=dtype)
+        self.hi = np.empty(capacity, dtype=dtype)
+        self.max_end = np.empty(capacity, dtype=dtype)
+        self.left = np.empty(capacity, dtype=np.int32)
+        self.right = np.empty(capacity, dtype=np.int32)
+        self.parent = np.empty(capacity, dtype=np.int32)
+        self.color = np.empty(capacity, dtype=np.uint8)
+
+        # Slot 0 is the NIL leaf: black, linked to itself, with a max endpoint below any real one.
+        # parent[NIL] is scratch space: rotations may overwrite it and nothing reads it.
+        self._integer = np.issubdtype(dtype, np.integer)  # Endpoints must then be whole numbers
+        lowest = np.iinfo(dtype).min if self._integer else -np.inf
+        self.lo[NIL] = self.hi[NIL] = self.max_end[NIL] = lowest
+        self.left[NIL] = self.right[NIL] = self.parent[NIL] = NIL
+        self.color[NIL] = BLACK
+
+        self.size = 1  # Next free slot
+        self.root = NIL
+        self._version = 0  # Bumped on every structural change
+        self._viz_cache = (-1, None, None, None)  # (version, G, pos, labels) of the last visualize()
+
+    def _grow(self):
+        # Double every array, keeping the slots already in use
+        capacity = 2 * len(self.lo)
+        for name in ('lo', 'hi', 'max_end', 'left', 'right', 'parent', 'color'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def interval(self, node):
+        # The interval stored at a node index, as a tuple of Python numbers
+        return (self.lo[node].item(), self.hi[node].item())
+
+    def rotate_left(self, node):
+        self._version += 1
+        self.root = _rotate_left(self.hi, self.max_end, self.left, self.right, self.parent, self.root, node)
+
+    def rotate_right(self, node):
+        self._version += 1
+        self.root = _rotate_right(self.hi, self.max_end, self.left, self.right, self.parent, self.root, node)
+
+    def fix_insert(self, node):
+        self.root = _fix_insert(self.hi, self.max_end, self.left, self.right, self.parent, self.color, self.root, node)
+
+    def insert(self, interval):
+        low, high = interval
+        if self._integer and (int(low) != low or int(high) != high):
+            raise ValueError(f"Interval {interval} has non-integer endpoints, but the tree stores {self.lo.dtype}")
+
+        self._version += 1
+        if self.size == len(self.lo):
+            self._grow()
+        new_node = self.size
+        self.size += 1
+
+        self.lo[new_node] = low
+        self.hi[new_node] = self.max_end[new_node] = high
+        self.left[new_node] = self.right[new_node] = NIL
+        self.color[new_node] = RED  # New nodes are always red
+
+        self.root = _bst_insert(self.lo, self.left, self.right, self.parent, self.root, new_node)
+        self.fix_insert(new_node)
+
+        # Update max_end from the inserted node upwards
+        self.update_max_endpoint_upwards(new_node)
+
+    def build(self, intervals):
+        """Replace the contents of the tree with intervals, built directly as a balanced tree.
+
+        One argsort by low end, one pass to link the nodes and one pass to fill max_end: no
+        rotations and no upward max endpoint walks, so it beats inserting the intervals one by one.
+        """
+        intervals = np.asarray(intervals).reshape(-1, 2)
+        if self._integer:
+            converted = intervals.astype(self.lo.dtype)
+            if not np.array_equal(converted, intervals):
+                raise ValueError(f"Intervals have non-integer endpoints, but the tree stores {self.lo.dtype}")
+            intervals = converted
+        n = len(intervals)
+        while len(self.lo) < n + 1:
+            self._grow()
+        order = np.argsort(intervals[:, 0], kind='stable')
+        self.lo[1:n + 1] = intervals[order, 0]
+        self.hi[1:n + 1] = intervals[order, 1]
+
+        self._version += 1
+        self.size = n + 1
+        self.root = _build_balanced(self.hi, self.max_end, self.left, self.right, self.parent, self.color, n)
+
+    def update_max_endpoint(self, node):
+        _update_max_endpoint(self.hi, self.max_end, self.left, self.right, node)
+
+    def update_max_endpoint_upwards(self, node):
+        _update_max_endpoint_upwards(self.hi, self.max_end, self.left, self.right, self.parent, node)
+
+    def overlap_search(self, interval):
+        """Search for any interval in the tree that overlaps with the given interval."""
+        low, high = interval
+        lo, hi, max_end, left, right = self.lo, self.hi, self.max_end, self.left, self.right
+        node = self.root
+        while node != NIL:
+            if lo[node] <= high and low <= hi[node]:
+                return self.interval(node)
+            if left[node] != NIL and max_end[left[node]] >= low:
+                node = left[node]
+            else:
+                node = right[node]
+        return None
+
+    def overlap_search_batch(self, queries):
+        """Run overlap_search for many queries at once, walking the tree for all of them in lockstep.
+
+        queries is an (N, 2) array of (low, high) pairs. Each step moves every unfinished query one
+        level down with NumPy array operations, so the Python loop runs once per tree level rather
+        than once per node per query. Returns an array of N node indices: tree.interval(i) is an
+        interval overlapping that query, NIL means none does.
+        """
+        queries = np.asarray(queries).reshape(-1, 2)
+        if not (self._integer and np.issubdtype(queries.dtype, np.floating)):
+            queries = queries.astype(self.lo.dtype, copy=False)
+        # Float queries against integer endpoints stay float64 and NumPy compares the two exactly:
+        # casting them would truncate 1.5 to 1 and has no integer for inf or NaN
+        q_lo, q_hi = queries[:, 0], queries[:, 1]
+        n = self.size - 1
+        if 0 < n <= _FLAT_SCAN_MAX:
+            # Small tree: comparing every query against every interval at once beats walking it
+            mask = (self.lo[None, 1:n + 1] <= q_hi[:, None]) & (q_lo[:, None] <= self.hi[None, 1:n + 1])
+            first = mask.argmax(axis=1)  # First overlapping slot of each query, or 0 if none overlaps
+            return np.where(mask[np.arange(len(queries)), first], first + 1, NIL).astype(np.int32)
+        lo, hi, max_end, left, right = self.lo, self.hi, self.max_end, self.left, self.right
+        hits = np.full(len(queries), NIL, dtype=np.int32)
+        cur = np.full(len(queries), self.root, dtype=np.int32)
+        alive = np.flatnonzero(cur != NIL)  # Queries still descending
+        while len(alive):
+            node = cur[alive]
+            overlap = (lo[node] <= q_hi[alive]) & (q_lo[alive] <= hi[node])
+            hits[alive[overlap]] = node[overlap]
+            left_child = left[node]
+            go_left = (left_child != NIL) & (max_end[left_child] >= q_lo[alive])
+            nxt = np.where(go_left, left_child, right[node])
+            keep = ~overlap & (nxt != NIL)
+            alive = alive[keep]
+            cur[alive] = nxt[keep]
+        return hits
+
+    def flat_overlap(self, interval):
+        """Return the node indices of every stored interval that overlaps the given interval.
+
+        No tree walk at all: NumPy compares the query against every lo and hi in one linear pass.
+        Unlike overlap_search it finds all overlaps, not just the first one on its path.
+        """
+        low, high = interval
+        n = self.size
+        return np.flatnonzero((self.lo[1:n] <= high) & (low <= self.hi[1:n])) + 1
+
+    def inorder_traversal(self, node, out=None):
+        # Collect one string per node and print them in a single call; pass a list as out to
+        # receive the strings instead
+        parts = [] if out is None else out
+        stack = []
+        current = node
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = self.left[current]
+            node = stack.pop()
+            parts.append(f'({self.lo[node]:g}, {self.hi[node]:g}) (max={self.max_end[node]:g})')
+            current = self.right[node]
+        if out is None:
+            print(' '.join(parts), end=' ')
+
+    def visualize(self):
+        version, G, pos, labels = self._viz_cache
+        if version != self._version:
+            # The tree changed since the last call, so rebuild the graph and its layout
+            G = nx.DiGraph()
+            labels = {}
+            self._build_visual(self.root, G, labels)
+            pos = graphviz_layout(G, prog="dot")  # Tree-like layout using pydot and graphviz
+            self._viz_cache = (self._version, G, pos, labels)
+        colors = [G.nodes[n]['color'] for n in G.nodes]
+        nx.draw(G, pos, labels=labels, node_color=colors, with_labels=True, node_size=8000, font_size=10, font_color='white')
+        plt.show()
+
+    def _build_visual(self, node, G, labels):
+        left, right = self.left, self.right
+        nodes_data = []
+        edges = []
+        queue = deque([node] if node != NIL else [])
+        while queue:
+            node = queue.popleft()
+            key = self.interval(node)
+            # Label includes both the interval and max endpoint in its subtree
+            nodes_data.append((key, {'color': _VIZ_COLOR[self.color[node]]}))
+            labels[key] = f'({self.lo[node]:g}, {self.hi[node]:g}) (max={self.max_end[node]:g})'
+            if left[node] != NIL:
+                edges.append((key, self.interval(left[node])))
+                queue.append(left[node])
+            if right[node] != NIL:
+                edges.append((key, self.interval(right[node])))
+                queue.append(right[node])
+        G.add_nodes_from(nodes_data)
+        G.add_edges_from(edges)
+
+# Example usage of the IntervalTree class:
+if __name__ == '__main__':
+    tree = IntervalTree(dtype=np.int64)  # The example endpoints are all integers
+
+    # List of intervals to insert into the tree (e.g., for a scheduling program)
+    intervals = [(4, 5), (3, 12), (24, 29), (48, 58), (6, 12), (43, 45), (38, 43),
+        (5, 7), (41, 43), (66, 73), (47, 53), (64, 67), (72, 81),
+        (11, 12), (85, 89), (83, 90), (30, 35), (17, 27), (53, 57),
+        (51, 59), (81, 89), (40, 49), (85, 94), (58, 62), (25, 32),
+        (37, 45), (85, 94), (11, 21), (54, 60), (12, 17)]
+
+    # Insert intervals into the tree
+    for interval in intervals:
+        tree.insert(interval)
+
+    # Perform an inorder traversal to show the tree structure and max endpoints
+    print("Inorder traversal of the Interval Tree:")
+    tree.inorder_traversal(tree.root)
+    print("\nVisualizing the Interval Tree with Max Endpoints:")
+    tree.visualize()
+
+    # Search for overlapping intervals
+    search_interval = (1, 16)
+    result = tree.overlap_search(search_interval)
+    if result:
+        print(f"\nInterval {search_interval} overlaps with {result} in the tree.")
+    else:
+        print(f"\nNo overlapping interval found for {search_interval}.")
+
+    # Search for several intervals at once
+    search_intervals = [(1, 16), (13, 14), (60, 63), (95, 99), (90.5, float('inf'))]
+    for search_interval, node in zip(search_intervals, tree.overlap_search_batch(search_intervals)):
+        if node != NIL:
+            print(f"Interval {search_interval} overlaps with {tree.interval(node)} in the tree.")
+        else:
+            print(f"No overlapping interval found for {search_interval}.")
+
+    # List every stored interval that overlaps a query, not just the first one found
+    search_interval = (1, 16)
+    print(f"Intervals overlapping {search_interval}:", [tree.interval(node) for node in tree.flat_overlap(search_interval)])
+
+    # Build the same set of intervals as a balanced tree in one go
+    built = IntervalTree(dtype=np.int64)
+    built.build(intervals)
+    print("\nInorder traversal of the bulk-built Interval Tree:")
+    built.inorder_traversal(built.root)
+    print()
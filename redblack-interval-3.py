@@ -0,0 +1,291 @@
+#	1.	Same interval tree as redblack-interval.py, but every node is a fixed-size record in one contiguous
+#       ctypes array instead of a separate Python object scattered around the heap.
+#	2.	A node is an integer index into that array. Index 0 is the NIL leaf, with max_end = -inf.
+#	3.	Needs only the standard library: this is the array layout of redblack-interval-2.py for when NumPy
+#       is not available. The drawing libraries are imported inside visualize(), since matplotlib needs NumPy.
+#	4.	ctypes arrays cannot grow in place, so a full array is copied into one twice the size.
+
+import ctypes
+from collections import deque
+
+RED = 0
+BLACK = 1
+_VIZ_COLOR = ('red', 'black')  # Drawing color for RED and BLACK, indexed by color
+
+NIL = 0  # Index of the shared NIL leaf
+
+
+class _Node(ctypes.Structure):
+    _fields_ = [
+        ('lo', ctypes.c_double),
+        ('hi', ctypes.c_double),
+        ('max_end', ctypes.c_double),  # Augmented data: maximum endpoint in the subtree
+        ('left', ctypes.c_int32),
+        ('right', ctypes.c_int32),
+        ('parent', ctypes.c_int32),
+        ('color', ctypes.c_uint8),
+    ]
+
+
+class IntervalTree:
+    def __init__(self, capacity=16):
+        self.nodes = (_Node * capacity)()
+
+        # Slot 0 is the NIL leaf: black, linked to itself, with a max endpoint of negative infinity.
+        # Its parent is scratch space: rotations may overwrite it and nothing reads it.
+        nil = self.nodes[NIL]
+        nil.lo = nil.hi = nil.max_end = float('-inf')
+        nil.left = nil.right = nil.parent = NIL
+        nil.color = BLACK
+
+        self.size = 1  # Next free slot
+        self.root = NIL
+        self._version = 0  # Bumped on every structural change
+        self._viz_cache = (-1, None, None, None)  # (version, G, pos, labels) of the last visualize()
+
+    def _grow(self):
+        # Copy the records into an array twice the size
+        old = self.nodes
+        self.nodes = (_Node * (2 * len(old)))()
+        ctypes.memmove(self.nodes, old, ctypes.sizeof(old))
+
+    def interval(self, node):
+        # The interval stored at a node index, as a tuple
+        record = self.nodes[node]
+        return (record.lo, record.hi)
+
+    def rotate_left(self, node):
+        self._version += 1
+        nodes = self.nodes
+        x = nodes[node]
+        right_child = x.right
+        y = nodes[right_child]
+        x.right = y.left
+        nodes[y.left].parent = node  # No NIL check: the NIL leaf's parent is scratch
+        y.parent = x.parent
+        if x.parent == NIL:
+            self.root = right_child
+        else:
+            p = nodes[x.parent]
+            if node == p.left:
+                p.left = right_child
+            else:
+                p.right = right_child
+        y.left = node
+        x.parent = right_child
+
+        # Update max_end after rotation
+        self.update_max_endpoint(node)
+        self.update_max_endpoint(right_child)
+
+    def rotate_right(self, node):
+        self._version += 1
+        nodes = self.nodes
+        x = nodes[node]
+        left_child = x.left
+        y = nodes[left_child]
+        x.left = y.right
+        nodes[y.right].parent = node  # No NIL check: the NIL leaf's parent is scratch
+        y.parent = x.parent
+        if x.parent == NIL:
+            self.root = left_child
+        else:
+            p = nodes[x.parent]
+            if node == p.right:
+                p.right = left_child
+            else:
+                p.left = left_child
+        y.right = node
+        x.parent = left_child
+
+        # Update max_end after rotation
+        self.update_max_endpoint(node)
+        self.update_max_endpoint(left_child)
+
+    def fix_insert(self, node):
+        nodes = self.nodes
+        while node != self.root and nodes[nodes[node].parent].color == RED:
+            p = nodes[node].parent
+            grand = nodes[p].parent
+            if p == nodes[grand].left:
+                uncle = nodes[grand].right
+                if nodes[uncle].color == RED:
+                    nodes[p].color = BLACK
+                    nodes[uncle].color = BLACK
+                    nodes[grand].color = RED
+                    node = grand
+                else:
+                    if node == nodes[p].right:
+                        node = p
+                        self.rotate_left(node)
+                        p = nodes[node].parent  # The rotation moved node below its old child
+                    nodes[p].color = BLACK
+                    nodes[grand].color = RED
+                    self.rotate_right(grand)
+            else:
+                uncle = nodes[grand].left
+                if nodes[uncle].color == RED:
+                    nodes[p].color = BLACK
+                    nodes[uncle].color = BLACK
+                    nodes[grand].color = RED
+                    node = grand
+                else:
+                    if node == nodes[p].left:
+                        node = p
+                        self.rotate_right(node)
+                        p = nodes[node].parent  # The rotation moved node below its old child
+                    nodes[p].color = BLACK
+                    nodes[grand].color = RED
+                    self.rotate_left(grand)
+        nodes[self.root].color = BLACK
+
+    def insert(self, interval):
+        self._version += 1
+        if self.size == len(self.nodes):
+            self._grow()
+        nodes = self.nodes
+        new_node = self.size
+        self.size += 1
+
+        low, high = interval
+        record = nodes[new_node]
+        record.lo = low
+        record.hi = record.max_end = high
+        record.left = record.right = NIL
+        record.color = RED  # New nodes are always red
+
+        p = NIL
+        current = self.root
+        while current != NIL:
+            p = current
+            if low < nodes[current].lo:
+                current = nodes[current].left
+            else:
+                current = nodes[current].right
+
+        record.parent = p
+
+        if p == NIL:
+            self.root = new_node
+        elif low < nodes[p].lo:
+            nodes[p].left = new_node
+        else:
+            nodes[p].right = new_node
+
+        # Raise max_end on the ancestors before fixing up: rotations recompute from the
+        # children, so they only produce correct values once the children are already correct
+        self._bubble_max(p, record.hi)
+        self.fix_insert(new_node)
+
+    def update_max_endpoint(self, node):
+        if node == NIL:
+            return
+
+        # Max endpoint is the maximum of the node's high end and the max_end of its children
+        nodes = self.nodes
+        record = nodes[node]
+        record.max_end = max(record.hi, nodes[record.left].max_end, nodes[record.right].max_end)
+
+    def _bubble_max(self, node, new_high):
+        # A new interval can only raise an ancestor's max_end, and once one ancestor is already
+        # at least new_high, every ancestor above it is too
+        nodes = self.nodes
+        while node != NIL and new_high > nodes[node].max_end:
+            nodes[node].max_end = new_high
+            node = nodes[node].parent
+
+    def overlap_search(self, interval):
+        """Search for any interval in the tree that overlaps with the given interval."""
+        low, high = interval
+        nodes = self.nodes
+        node = self.root
+        while node != NIL:
+            record = nodes[node]
+            if record.lo <= high and low <= record.hi:
+                return (record.lo, record.hi)
+            if record.left != NIL and nodes[record.left].max_end >= low:
+                node = record.left
+            else:
+                node = record.right
+        return None
+
+    def inorder_traversal(self, node, out=None):
+        # Collect one string per node and print them in a single call; pass a list as out to
+        # receive the strings instead
+        parts = [] if out is None else out
+        nodes = self.nodes
+        stack = []
+        current = node
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = nodes[current].left
+            record = nodes[stack.pop()]
+            parts.append(f'({record.lo:g}, {record.hi:g}) (max={record.max_end:g})')
+            current = record.right
+        if out is None:
+            print(' '.join(parts), end=' ')
+
+    def visualize(self):
+        import matplotlib.pyplot as plt
+        import networkx as nx
+        from networkx.drawing.nx_pydot import graphviz_layout
+
+        version, G, pos, labels = self._viz_cache
+        if version != self._version:
+            # The tree changed since the last call, so rebuild the graph and its layout
+            G = nx.DiGraph()
+            labels = {}
+            self._build_visual(self.root, G, labels)
+            pos = graphviz_layout(G, prog="dot")  # Tree-like layout using pydot and graphviz
+            self._viz_cache = (self._version, G, pos, labels)
+        colors = [G.nodes[n]['color'] for n in G.nodes]
+        nx.draw(G, pos, labels=labels, node_color=colors, with_labels=True, node_size=8000, font_size=10, font_color='white')
+        plt.show()
+
+    def _build_visual(self, node, G, labels):
+        nodes = self.nodes
+        nodes_data = []
+        edges = []
+        queue = deque([node] if node != NIL else [])
+        while queue:
+            record = nodes[queue.popleft()]
+            key = (record.lo, record.hi)
+            # Label includes both the interval and max endpoint in its subtree
+            nodes_data.append((key, {'color': _VIZ_COLOR[record.color]}))
+            labels[key] = f'({record.lo:g}, {record.hi:g}) (max={record.max_end:g})'
+            for child in (record.left, record.right):
+                if child != NIL:
+                    edges.append((key, self.interval(child)))
+                    queue.append(child)
+        G.add_nodes_from(nodes_data)
+        G.add_edges_from(edges)
+
+# Example usage of the IntervalTree class:
+if __name__ == '__main__':
+    tree = IntervalTree()
+
+    # List of intervals to insert into the tree (e.g., for a scheduling program)
+    intervals = [(4, 5), (3, 12), (24, 29), (48, 58), (6, 12), (43, 45), (38, 43),
+        (5, 7), (41, 43), (66, 73), (47, 53), (64, 67), (72, 81),
+        (11, 12), (85, 89), (83, 90), (30, 35), (17, 27), (53, 57),
+        (51, 59), (81, 89), (40, 49), (85, 94), (58, 62), (25, 32),
+        (37, 45), (85, 94), (11, 21), (54, 60), (12, 17)]
+
+    # Insert intervals into the tree
+    for interval in intervals:
+        tree.insert(interval)
+
+    # Perform an inorder traversal to show the tree structure and max endpoints
+    print("Inorder traversal of the Interval Tree:")
+    tree.inorder_traversal(tree.root)
+    print("\nVisualizing the Interval Tree with Max Endpoints:")
+    tree.visualize()
+
+    # Search for overlapping intervals
+    search_interval = (1, 16)
+    result = tree.overlap_search(search_interval)
+    if result:
+        print(f"\nInterval {search_interval} overlaps with {result} in the tree.")
+    else:
+        print(f"\nNo overlapping interval found for {search_interval}.")
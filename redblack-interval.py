@@ -28,45 +28,67 @@ Two intervals [low1, high1] and [low2, high2] overlap if:
 
   """
 
-import matplotlib.pyplot as plt
-import networkx as nx
-from networkx.drawing.nx_pydot import graphviz_layout
+from collections import OrderedDict, deque
+
+DEBUG = False  # Set to True to trace inserts, rotations and max endpoint updates
+
+_QUERY_CACHE_SIZE = 4096  # overlap_search answers kept between changes to the tree
+
+RED = 0
+BLACK = 1
+_VIZ_COLOR = ('red', 'black')  # Drawing color for RED and BLACK, indexed by node.color
 
 class IntervalNode:
-    def __init__(self, interval, NIL_LEAF=None):
-        self.interval = interval  # Store the interval [low, high]
-        self.color = 'RED'  # New nodes are always red
+    __slots__ = ('lo', 'hi', 'color', 'left', 'right', 'parent', 'max_endpoint')
+
+    def __init__(self, lo, hi, NIL_LEAF=None):
+        self.lo = lo  # Store the interval [low, high] as two plain attributes
+        self.hi = hi
+        self.color = RED  # New nodes are always red
         self.left = NIL_LEAF  # Assign NIL_LEAF instead of None
         self.right = NIL_LEAF  # Assign NIL_LEAF instead of None
         self.parent = None
-        self.max_endpoint = interval[1]  # Augmented data: maximum endpoint in the subtree
+        self.max_endpoint = hi  # Augmented data: maximum endpoint in the subtree
 
         # Debugging the node creation
-        print(f"Created node with interval {self.interval} and max endpoint {self.max_endpoint}")
+        if DEBUG:
+            print(f"Created node with interval {self.interval} and max endpoint {self.max_endpoint}")
+
+    @property
+    def interval(self):
+        return (self.lo, self.hi)
 
 class IntervalTree:
     def __init__(self):
         # Step 1: Create the NIL_LEAF node with None for left and right
-        self.NIL_LEAF = IntervalNode((float('-inf'), float('-inf')))
+        self.NIL_LEAF = IntervalNode(float('-inf'), float('-inf'))
         # Step 2: Set the NIL_LEAF's left and right to itself after creation
-        self.NIL_LEAF.color = 'BLACK'
+        self.NIL_LEAF.color = BLACK
         self.NIL_LEAF.left = self.NIL_LEAF
         self.NIL_LEAF.right = self.NIL_LEAF
         self.NIL_LEAF.max_endpoint = float('-inf')  # NIL nodes have a max endpoint of negative infinity
         self.root = self.NIL_LEAF
+        self._version = 0  # Bumped on every structural change
+        self._viz_cache = (-1, None, None, None)  # (version, G, pos, labels) of the last visualize()
+        self._query_cache = OrderedDict()  # query interval -> overlap_search answer, least recent first
+        self._query_cache_version = 0  # _version the cached answers were computed at
+        self._rot = (self.rotate_left, self.rotate_right)  # Indexed by side in fix_insert
 
-        print(f"Initialized NIL_LEAF: {self.NIL_LEAF}")
+        if DEBUG:
+            print(f"Initialized NIL_LEAF: {self.NIL_LEAF}")
 
     def rotate_left(self, node):
-        print(f"Rotate left on node {node.interval}")
+        self._version += 1
+        if DEBUG:
+            print(f"Rotate left on node {node.interval}")
         right_child = node.right
         node.right = right_child.left
-        if right_child.left != self.NIL_LEAF:
+        if right_child.left is not self.NIL_LEAF:
             right_child.left.parent = node
         right_child.parent = node.parent
         if node.parent is None:
             self.root = right_child
-        elif node == node.parent.left:
+        elif node is node.parent.left:
             node.parent.left = right_child
         else:
             node.parent.right = right_child
@@ -78,15 +100,17 @@ class IntervalTree:
         self.update_max_endpoint(right_child)
 
     def rotate_right(self, node):
-        print(f"Rotate right on node {node.interval}")
+        self._version += 1
+        if DEBUG:
+            print(f"Rotate right on node {node.interval}")
         left_child = node.left
         node.left = left_child.right
-        if left_child.right != self.NIL_LEAF:
+        if left_child.right is not self.NIL_LEAF:
             left_child.right.parent = node
         left_child.parent = node.parent
         if node.parent is None:
             self.root = left_child
-        elif node == node.parent.right:
+        elif node is node.parent.right:
             node.parent.right = left_child
         else:
             node.parent.left = left_child
@@ -98,52 +122,64 @@ class IntervalTree:
         self.update_max_endpoint(left_child)
 
     def fix_insert(self, node):
-        print(f"Fixing insert on node with interval {node.interval}")
-        while node != self.root and node.parent.color == 'RED':
-            if node.parent == node.parent.parent.left:
-                uncle = node.parent.parent.right
-                if uncle.color == 'RED':
-                    node.parent.color = 'BLACK'
-                    uncle.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    node = node.parent.parent
-                else:
-                    if node == node.parent.right:
-                        node = node.parent
-                        self.rotate_left(node)
-                    node.parent.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    self.rotate_right(node.parent.parent)
+        if DEBUG:
+            print(f"Fixing insert on node with interval {node.interval}")
+        rotate = self._rot
+        while node is not self.root and node.parent.color == RED:
+            parent = node.parent
+            grand = parent.parent
+            # The two cases are mirror images, so one body handles both: side is 0 when parent is
+            # a left child, 1 when it is a right child, and rotate[side] turns toward that side's sibling
+            side = 0 if parent is grand.left else 1
+            uncle = grand.right if side == 0 else grand.left
+            if uncle.color == RED:
+                parent.color = BLACK
+                uncle.color = BLACK
+                grand.color = RED
+                node = grand
             else:
-                uncle = node.parent.parent.left
-                if uncle.color == 'RED':
-                    node.parent.color = 'BLACK'
-                    uncle.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    node = node.parent.parent
-                else:
-                    if node == node.parent.left:
-                        node = node.parent
-                        self.rotate_right(node)
-                    node.parent.color = 'BLACK'
-                    node.parent.parent.color = 'RED'
-                    self.rotate_left(node.parent.parent)
-        self.root.color = 'BLACK'
-
-    def insert(self, interval):
-        print(f"Inserting interval {interval}")
-        new_node = IntervalNode(interval, self.NIL_LEAF)  # Create a new node with NIL_LEAF as children
+                if node is (parent.right if side == 0 else parent.left):
+                    node = parent
+                    rotate[side](node)
+                    parent = node.parent  # The rotation moved node below its old child
+                parent.color = BLACK
+                grand.color = RED
+                rotate[1 - side](grand)
+        self.root.color = BLACK
+
+    def insert(self, interval, merge=False):
+        if merge:
+            # Fuse the new interval with every stored interval that overlaps it or, when both
+            # endpoints are ints, sits right next to it, so (1, 3) + (2, 6) + (7, 9) is stored as
+            # (1, 9). Other endpoints only merge on overlap: (0.0, 0.5) + (1.2, 2.0) stay apart,
+            # while (0.0, 0.5) + (0.5, 2.0) become (0.0, 2.0)
+            low, high = interval
+            while True:
+                pad = 1 if isinstance(low, int) and isinstance(high, int) else 0
+                hit = self.overlap_search((low - pad, high + pad))
+                if hit is None:
+                    break
+                low, high = min(low, hit[0]), max(high, hit[1])
+                self.delete(hit)
+            interval = (low, high)
+
+        self._version += 1
+        if DEBUG:
+            print(f"Inserting interval {interval}")
+        new_node = IntervalNode(interval[0], interval[1], self.NIL_LEAF)  # Create a new node with NIL_LEAF as children
 
         parent = None
         current = self.root
 
         # Debug: Check root initialization
-        if current is None:
+        if DEBUG and current is None:
             raise RuntimeError("Root is None, should be NIL_LEAF")
 
-        while current != self.NIL_LEAF:
+        NIL = self.NIL_LEAF
+        low = new_node.lo
+        while current is not NIL:
             parent = current
-            if new_node.interval[0] < current.interval[0]:
+            if low < current.lo:
                 current = current.left
             else:
                 current = current.right
@@ -152,80 +188,440 @@ class IntervalTree:
 
         if parent is None:
             self.root = new_node
-        elif new_node.interval[0] < parent.interval[0]:
+        elif low < parent.lo:
             parent.left = new_node
         else:
             parent.right = new_node
 
-        new_node.color = 'RED'
+        new_node.color = RED
+
+        # Raise max_endpoint on the ancestors before fixing up: rotations recompute from the
+        # children, so they only produce correct values once the children are already correct
+        self._bubble_max(parent, new_node.hi)
         self.fix_insert(new_node)
 
-        # Update max_endpoint from the inserted node upwards
-        print(f"Calling update_max_endpoint_upwards for node {new_node.interval}")
-        self.update_max_endpoint_upwards(new_node)
+    def extend(self, intervals):
+        """Insert many intervals in an order that lets the tree stay balanced without rotations.
+
+        The intervals are sorted by low end and inserted level by level: the overall median first,
+        then the medians of the two halves, then of the four quarters, and so on. Every new node
+        lands where a balanced tree wants it, so fix_insert only has to recolor. Into an empty
+        tree with distinct low ends this takes no rotations at all, where inserting in arbitrary
+        order rotates about once for every two intervals.
+        """
+        intervals = sorted(intervals, key=lambda interval: interval[0])
+        ranges = deque([(0, len(intervals) - 1)])  # Index ranges of the sorted list still to insert
+        while ranges:
+            first, last = ranges.popleft()
+            if first > last:
+                continue
+            middle = (first + last) // 2
+            self.insert(intervals[middle])
+            ranges.append((first, middle - 1))
+            ranges.append((middle + 1, last))
+
+    def minimum(self, node):
+        NIL = self.NIL_LEAF
+        while node.left is not NIL:
+            node = node.left
+        return node
+
+    def transplant(self, u, v):
+        # Put the subtree rooted at v where the subtree rooted at u was
+        if u.parent is None:
+            self.root = v
+        elif u is u.parent.left:
+            u.parent.left = v
+        else:
+            u.parent.right = v
+        v.parent = u.parent  # Set even when v is NIL_LEAF: fix_delete reads it from there
+
+    def fix_delete(self, node):
+        if DEBUG:
+            print(f"Fixing delete on node with interval {node.interval}")
+        while node is not self.root and node.color == BLACK:
+            parent = node.parent
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self.rotate_left(parent)
+                    sibling = parent.right
+                if sibling.left.color == BLACK and sibling.right.color == BLACK:
+                    sibling.color = RED
+                    node = parent
+                else:
+                    if sibling.right.color == BLACK:
+                        sibling.left.color = BLACK
+                        sibling.color = RED
+                        self.rotate_right(sibling)
+                        sibling = parent.right
+                    sibling.color = parent.color
+                    parent.color = BLACK
+                    sibling.right.color = BLACK
+                    self.rotate_left(parent)
+                    node = self.root
+            else:
+                sibling = parent.left
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self.rotate_right(parent)
+                    sibling = parent.left
+                if sibling.right.color == BLACK and sibling.left.color == BLACK:
+                    sibling.color = RED
+                    node = parent
+                else:
+                    if sibling.left.color == BLACK:
+                        sibling.right.color = BLACK
+                        sibling.color = RED
+                        self.rotate_left(sibling)
+                        sibling = parent.left
+                    sibling.color = parent.color
+                    parent.color = BLACK
+                    sibling.left.color = BLACK
+                    self.rotate_right(parent)
+                    node = self.root
+        node.color = BLACK
+
+    def _find(self, interval):
+        # Equal low ends can end up on either side of each other after rotations, so search both
+        # children on a tie; max_endpoint rules out subtrees that cannot hold the high end
+        low, high = interval
+        NIL = self.NIL_LEAF
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is NIL or node.max_endpoint < high:
+                continue
+            if low < node.lo:
+                stack.append(node.left)
+            elif low > node.lo:
+                stack.append(node.right)
+            elif high == node.hi:
+                return node
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+        return None
+
+    def delete(self, interval):
+        if DEBUG:
+            print(f"Deleting interval {interval}")
+        z = self._find(interval)
+        if z is None:
+            return False  # Not in the tree
+        self._version += 1
+
+        # y is the node that leaves its position: z itself, or z's successor when z has two children
+        if z.left is self.NIL_LEAF or z.right is self.NIL_LEAF:
+            y = z
+        else:
+            y = self.minimum(z.right)
+        y_original_color = y.color
+
+        if z.left is self.NIL_LEAF:
+            x = z.right
+            self.transplant(z, z.right)
+        elif z.right is self.NIL_LEAF:
+            x = z.left
+            self.transplant(z, z.left)
+        else:
+            x = y.right
+            if y.parent is z:
+                x.parent = y  # Set even when x is NIL_LEAF: fix_delete reads it from there
+            else:
+                self.transplant(y, y.right)
+                y.right = z.right
+                y.right.parent = y
+            self.transplant(z, y)
+            y.left = z.left
+            y.left.parent = y
+            y.color = z.color
+
+        # Removing an interval can lower max_endpoint anywhere above the spot y left (y included,
+        # in its new place), so recompute those before fix_delete's rotations read them
+        if x.parent is not None:
+            self.update_max_endpoint_upwards(x.parent)
+
+        if y_original_color == BLACK:
+            self.fix_delete(x)
+        return True
 
     def update_max_endpoint(self, node):
-        if node == self.NIL_LEAF:
+        if node is self.NIL_LEAF:
             return
 
         # Max endpoint is the maximum of the node's interval endpoint and the max_endpoints of its children
-        node.max_endpoint = max(node.interval[1], node.left.max_endpoint, node.right.max_endpoint)
-        print(f"Updated max endpoint for node {node.interval}: {node.max_endpoint}")
+        node.max_endpoint = max(node.hi, node.left.max_endpoint, node.right.max_endpoint)
+        if DEBUG:
+            print(f"Updated max endpoint for node {node.interval}: {node.max_endpoint}")
+
+    def _bubble_max(self, node, new_high):
+        # A new interval can only raise an ancestor's max_endpoint, and once one ancestor is already
+        # at least new_high, every ancestor above it is too
+        while node is not None and new_high > node.max_endpoint:
+            if DEBUG:
+                print(f"Raising max endpoint for node {node.interval} to {new_high}")
+            node.max_endpoint = new_high
+            node = node.parent
 
     def update_max_endpoint_upwards(self, node):
-        while node != self.NIL_LEAF:
-            print(f"Updating max endpoint for node {node.interval}")
-            self.update_max_endpoint(node)
+        NIL = self.NIL_LEAF
+        update = self.update_max_endpoint
+        while node is not NIL:
+            if DEBUG:
+                print(f"Updating max endpoint for node {node.interval}")
+            update(node)
             if node.parent is None:  # Stop at root node
                 break
             node = node.parent
 
     def overlap_search(self, interval):
-        """Search for any interval in the tree that overlaps with the given interval."""
-        return self._overlap_search(self.root, interval)
+        """Search for any interval in the tree that overlaps with the given interval.
+
+        Answers are remembered until the tree next changes, so a repeated query is a dict lookup.
+        """
+        cache = self._query_cache
+        if self._query_cache_version != self._version:
+            # The tree changed since these answers were computed
+            cache.clear()
+            self._query_cache_version = self._version
+        key = (interval[0], interval[1])
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        result = self._overlap_search(self.root, key)
+        cache[key] = result
+        if len(cache) > _QUERY_CACHE_SIZE:
+            cache.popitem(last=False)  # Forget the least recently used answer
+        return result
 
     def _overlap_search(self, node, interval):
-        if node == self.NIL_LEAF:
-            return None
-
-        if self._do_overlap(node.interval, interval):
-            return node.interval
-
-        if node.left != self.NIL_LEAF and node.left.max_endpoint >= interval[0]:
-            return self._overlap_search(node.left, interval)
-
-        return self._overlap_search(node.right, interval)
-
-    def _do_overlap(self, interval1, interval2):
-        """Check if two intervals overlap."""
-        return interval1[0] <= interval2[1] and interval2[0] <= interval1[1]
-
-    def inorder_traversal(self, node):
-        if node != self.NIL_LEAF:
-            self.inorder_traversal(node.left)
-            print(f'{node.interval} (max={node.max_endpoint})', end=' ')
-            self.inorder_traversal(node.right)
+        # At most one child can lead to an overlap, so walk down with a loop instead of recursing
+        low, high = interval
+        NIL = self.NIL_LEAF
+        while node is not NIL:
+            if node.lo <= high and low <= node.hi:
+                return node.interval
+
+            left = node.left
+            if left is not NIL and left.max_endpoint >= low:
+                node = left
+            else:
+                node = node.right
+        return None
+
+    def overlap_batch(self, intervals):
+        """Run overlap_search for many query intervals with a single inorder walk of the tree.
+
+        Queries are handled in order of their high end while the walk visits stored intervals in
+        order of their low end, so each stored interval is visited once for the whole batch. For
+        each query we keep the visited interval with the largest high end: if any stored interval
+        overlaps the query, that one does. Worth it when there are about as many queries as nodes.
+        Returns one result per query, in input order (None where nothing overlaps).
+        """
+        order = sorted(range(len(intervals)), key=lambda i: intervals[i][1])
+        results = [None] * len(intervals)
+        NIL = self.NIL_LEAF
+        stack = []
+        current = self.root
+        best = None  # Visited node with the largest high end so far
+        for i in order:
+            low, high = intervals[i]
+            # Visit every stored interval that starts at or before this query's high end
+            while stack or current is not NIL:
+                while current is not NIL:
+                    stack.append(current)
+                    current = current.left
+                node = stack[-1]
+                if node.lo > high:
+                    break
+                stack.pop()
+                if best is None or node.hi > best.hi:
+                    best = node
+                current = node.right
+            if best is not None and best.hi >= low:
+                results[i] = best.interval
+        return results
+
+    def freeze(self):
+        """Return a read-only FrozenIntervalTree with the same intervals, for faster queries."""
+        NIL = self.NIL_LEAF
+        intervals = []
+        stack = []
+        current = self.root
+        while stack or current is not NIL:
+            while current is not NIL:
+                stack.append(current)
+                current = current.left
+            node = stack.pop()
+            intervals.append(node.interval)
+            current = node.right
+        return FrozenIntervalTree(intervals)
+
+    def inorder_traversal(self, node, out=None):
+        # Collect one string per node and print them in a single call; pass a list as out to
+        # receive the strings instead
+        parts = [] if out is None else out
+        NIL = self.NIL_LEAF
+        stack = []
+        current = node
+        while stack or current is not NIL:
+            while current is not NIL:
+                stack.append(current)
+                current = current.left
+            node = stack.pop()
+            parts.append(f'{node.interval} (max={node.max_endpoint})')
+            current = node.right
+        if out is None:
+            print(' '.join(parts), end=' ')
 
     def visualize(self):
-        G = nx.DiGraph()
-        labels = {}
-        self._build_visual(self.root, G, labels)
-        pos = graphviz_layout(G, prog="dot")  # Tree-like layout using pydot and graphviz
+        # The drawing libraries are slow to import, so only load them when a picture is asked for
+        import matplotlib.pyplot as plt
+        import networkx as nx
+        from networkx.drawing.nx_pydot import graphviz_layout
+
+        version, G, pos, labels = self._viz_cache
+        if version != self._version:
+            # The tree changed since the last call, so rebuild the graph and its layout
+            G = nx.DiGraph()
+            labels = {}
+            self._build_visual(self.root, G, labels)
+            pos = graphviz_layout(G, prog="dot")  # Tree-like layout using pydot and graphviz
+            self._viz_cache = (self._version, G, pos, labels)
         colors = [G.nodes[n]['color'] for n in G.nodes]
         nx.draw(G, pos, labels=labels, node_color=colors, with_labels=True, node_size=8000, font_size=10, font_color='white')
         plt.show()
 
     def _build_visual(self, node, G, labels):
-        if node != self.NIL_LEAF:
+        NIL = self.NIL_LEAF
+        nodes_data = []
+        edges = []
+        queue = deque([node] if node is not NIL else [])
+        while queue:
+            node = queue.popleft()
+            key = node.interval
             # Label includes both the interval and max endpoint in its subtree
-            G.add_node(node.interval, color='red' if node.color == 'RED' else 'black')
-            labels[node.interval] = f'{node.interval} (max={node.max_endpoint})'
-            if node.left != self.NIL_LEAF:
-                G.add_edge(node.interval, node.left.interval)
-            if node.right != self.NIL_LEAF:
-                G.add_edge(node.interval, node.right.interval)
-            self._build_visual(node.left, G, labels)
-            self._build_visual(node.right, G, labels)
+            nodes_data.append((key, {'color': _VIZ_COLOR[node.color]}))
+            labels[key] = f'{key} (max={node.max_endpoint})'
+            if node.left is not NIL:
+                edges.append((key, node.left.interval))
+                queue.append(node.left)
+            if node.right is not NIL:
+                edges.append((key, node.right.interval))
+                queue.append(node.right)
+        G.add_nodes_from(nodes_data)
+        G.add_edges_from(edges)
+
+class FrozenIntervalTree:
+    """Read-only interval tree for interval sets that are built once and then queried many times.
+
+    The intervals sit in three flat lists in Eytzinger (heap) order: the root at index 0 and the
+    children of index i at 2i + 1 and 2i + 2. There are no node objects, colors or child pointers,
+    so it takes about a quarter of the memory of an IntervalTree. There is no insert or delete;
+    after changes, call IntervalTree.freeze() again.
+    """
+    __slots__ = ('lo', 'hi', 'max_end', 'size')
+
+    def __init__(self, intervals):
+        intervals = sorted(intervals, key=lambda interval: interval[0])  # Nearly free when already sorted
+
+        # Round the size up to a perfect tree (2^k - 1 slots) and fill the spare slots with empty
+        # intervals that sort last and never overlap anything
+        size = 0
+        while size < len(intervals):
+            size = 2 * size + 1
+        intervals += [(float('inf'), float('-inf'))] * (size - len(intervals))
+        self.size = size
+        lo = self.lo = [None] * size
+        hi = self.hi = [None] * size
+
+        # An inorder walk of the implicit tree visits its slots in sorted order, so hand out the
+        # sorted intervals one by one along that walk
+        stack = []
+        i = 0
+        k = 0
+        while stack or i < size:
+            while i < size:
+                stack.append(i)
+                i = 2 * i + 1
+            i = stack.pop()
+            lo[i], hi[i] = intervals[k]
+            k += 1
+            i = 2 * i + 2
+
+        # Every child sits after its parent, so filling from the back pushes each subtree's
+        # maximum into its parent before the parent passes it on. The -inf tail stands in for the
+        # children of the leaves, so overlap_search never has to check whether a child exists.
+        max_end = self.max_end = hi + [float('-inf')] * (size + 1)
+        for i in range(size - 1, 0, -1):
+            parent = (i - 1) // 2
+            if max_end[i] > max_end[parent]:
+                max_end[parent] = max_end[i]
+
+    def overlap_search(self, interval):
+        """Search for any interval in the tree that overlaps with the given interval."""
+        low, high = interval
+        lo, hi, max_end, size = self.lo, self.hi, self.max_end, self.size
+        i = 0
+        while i < size:
+            if low <= hi[i] and lo[i] <= high:
+                return (lo[i], hi[i])
+            i = 2 * i + 1  # Left child, unless nothing in its subtree reaches low
+            if max_end[i] < low:
+                i += 1
+        return None
+
+# Compiled version of insert and overlap_search, if _intervaltree.pyx has been built with
+# `cythonize -i _intervaltree.pyx`
+try:
+    from _intervaltree import IntervalTree as _CompiledIntervalTree
+except ImportError:
+    _CompiledIntervalTree = None
+
+class FastIntervalTree:
+    """IntervalTree with the same API, whose plain inserts and overlap_search run compiled code.
+
+    While only insert(interval) and overlap_search are used, the intervals live in the compiled
+    tree from _intervaltree.pyx. Any other call (a merging insert, delete, extend, overlap_batch,
+    freeze, visualize, inorder_traversal, root, ...) first moves them into a pure Python
+    IntervalTree, which then serves every call from there on. Endpoints that a C double cannot
+    hold exactly, such as very large ints or Fractions, make that move right away too. Without
+    the build, it is a pure Python IntervalTree from the start.
+    """
+
+    def __init__(self):
+        self._tree = IntervalTree() if _CompiledIntervalTree is None else _CompiledIntervalTree()
+
+    def _python_tree(self):
+        # Swap the compiled tree for a pure Python one holding the same intervals
+        tree = self._tree
+        if type(tree) is not IntervalTree:
+            python_tree = IntervalTree()
+            python_tree.extend(tree.intervals())
+            self._tree = tree = python_tree
+        return tree
+
+    def insert(self, interval, merge=False):
+        low, high = interval
+        if merge or type(self._tree) is IntervalTree or float(low) != low or float(high) != high:
+            self._python_tree().insert(interval, merge)
+        else:
+            self._tree.insert(interval)
+
+    def overlap_search(self, interval):
+        """Search for any interval in the tree that overlaps with the given interval."""
+        return self._tree.overlap_search(interval)
+
+    def __getattr__(self, name):
+        # Everything else is only in the pure Python tree. Special names and _tree itself are not:
+        # copy and pickle look those up before __init__ has run, and _python_tree needs _tree
+        if name.startswith('__') or name == '_tree':
+            raise AttributeError(name)
+        return getattr(self._python_tree(), name)
 
 # Example usage of the IntervalTree class:
 if __name__ == '__main__':
@@ -256,6 +652,35 @@ if __name__ == '__main__':
     else:
         print(f"\nNo overlapping interval found for {search_interval}.")
 
+    # Search for several intervals at once
+    search_intervals = [(1, 16), (13, 14), (60, 63), (95, 99)]
+    for search_interval, result in zip(search_intervals, tree.overlap_batch(search_intervals)):
+        if result:
+            print(f"Interval {search_interval} overlaps with {result} in the tree.")
+        else:
+            print(f"No overlapping interval found for {search_interval}.")
+
+    # Let insert fuse overlapping and back-to-back bookings into single blocks
+    merged = IntervalTree()
+    for interval in [(1, 3), (2, 6), (9, 12), (13, 15), (20, 22)]:
+        merged.insert(interval, merge=True)
+    print("\nMerged intervals:")
+    merged.inorder_traversal(merged.root)
+    print()
+
+    # Float endpoints only merge when they overlap: gaps like (0.5, 1.2) are kept
+    merged = IntervalTree()
+    for interval in [(0.0, 0.5), (1.2, 2.0), (2.0, 2.5)]:
+        merged.insert(interval, merge=True)
+    print("Merged float intervals:")
+    merged.inorder_traversal(merged.root)
+    print()
+
+    # Freeze the schedule once it stops changing, for faster read-only queries
+    frozen = tree.freeze()
+    search_interval = (60, 63)
+    print(f"Frozen tree: interval {search_interval} overlaps with {frozen.overlap_search(search_interval)}.")
+
 
     """
 The max_endpoint parameter (or simply max) in an interval tree is an augmented data field that helps efficiently manage and query intervals.
@@ -0,0 +1,158 @@
+# cython: language_level=3
+#	1.	Cython version of the subtree-count tree in redblack-count-aug-1.py. Nodes are cdef classes, so
+#       node.left, node.color and node.subtree_count are C struct fields instead of Python attributes.
+#	2.	Rotations, the insert fix-up and the count update are cdef methods: plain C calls with no Python
+#       call overhead. insert is cpdef, so Python code can still call tree.insert(x).
+#	3.	Build it in place with `cythonize -i redblack_aug.pyx` (needs `pip install cython` and a C compiler),
+#       then `import redblack_aug` and use redblack_aug.RedBlackTree like the pure Python one.
+
+cdef enum:
+    RED = 0
+    BLACK = 1
+
+
+cdef class Node:
+    cdef public long data
+    cdef public int color
+    cdef public Node left, right, parent
+    cdef public int subtree_count
+
+    def __init__(self, long data=0, Node NIL_LEAF=None):
+        self.data = data
+        self.color = RED  # New nodes are always red
+        self.left = NIL_LEAF
+        self.right = NIL_LEAF
+        self.parent = None
+        self.subtree_count = 1  # Track the number of nodes in the subtree (including this node)
+
+
+cdef class RedBlackTree:
+    cdef public Node NIL_LEAF
+    cdef public Node root
+
+    def __init__(self):
+        self.NIL_LEAF = Node()
+        self.NIL_LEAF.color = BLACK
+        self.NIL_LEAF.subtree_count = 0  # NIL nodes have a subtree count of 0
+        # NIL_LEAF.parent is scratch space: rotations may overwrite it and nothing reads it
+        self.root = self.NIL_LEAF
+
+    cdef void rotate_left(self, Node node):
+        cdef Node right_child = node.right
+        node.right = right_child.left
+        right_child.left.parent = node  # No NIL check: NIL_LEAF.parent is scratch
+        right_child.parent = node.parent
+        if node.parent is None:
+            self.root = right_child
+        elif node is node.parent.left:
+            node.parent.left = right_child
+        else:
+            node.parent.right = right_child
+        right_child.left = node
+        node.parent = right_child
+
+        # Update subtree counts after rotation
+        self.update_subtree_count(node)
+        self.update_subtree_count(right_child)
+
+    cdef void rotate_right(self, Node node):
+        cdef Node left_child = node.left
+        node.left = left_child.right
+        left_child.right.parent = node  # No NIL check: NIL_LEAF.parent is scratch
+        left_child.parent = node.parent
+        if node.parent is None:
+            self.root = left_child
+        elif node is node.parent.right:
+            node.parent.right = left_child
+        else:
+            node.parent.left = left_child
+        left_child.right = node
+        node.parent = left_child
+
+        # Update subtree counts after rotation
+        self.update_subtree_count(node)
+        self.update_subtree_count(left_child)
+
+    cdef void fix_insert(self, Node node):
+        cdef Node parent, grand, uncle
+        while node is not self.root and node.parent.color == RED:
+            parent = node.parent
+            grand = parent.parent
+            if parent is grand.left:
+                uncle = grand.right
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
+                else:
+                    if node is parent.right:
+                        node = parent
+                        self.rotate_left(node)
+                        parent = node.parent  # The rotation moved node below its old child
+                    parent.color = BLACK
+                    grand.color = RED
+                    self.rotate_right(grand)
+            else:
+                uncle = grand.left
+                if uncle.color == RED:
+                    parent.color = BLACK
+                    uncle.color = BLACK
+                    grand.color = RED
+                    node = grand
+                else:
+                    if node is parent.left:
+                        node = parent
+                        self.rotate_right(node)
+                        parent = node.parent  # The rotation moved node below its old child
+                    parent.color = BLACK
+                    grand.color = RED
+                    self.rotate_left(grand)
+        self.root.color = BLACK
+
+    cpdef void insert(self, long data):
+        cdef Node new_node = Node(data, self.NIL_LEAF)  # Create a new node with NIL_LEAF as children
+        cdef Node parent = None
+        cdef Node current = self.root
+
+        while current is not self.NIL_LEAF:
+            parent = current
+            current.subtree_count += 1  # The new node will land in this subtree
+            if data < current.data:
+                current = current.left
+            else:
+                current = current.right
+
+        new_node.parent = parent
+
+        if parent is None:
+            self.root = new_node
+        elif data < parent.data:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        self.fix_insert(new_node)
+
+    cdef void update_subtree_count(self, Node node):
+        if node is self.NIL_LEAF:
+            return
+
+        # Subtree count is 1 (itself) + left subtree count + right subtree count
+        node.subtree_count = 1 + node.left.subtree_count + node.right.subtree_count
+
+    def inorder_traversal(self, Node node, out=None):
+        # Collect one string per node and print them in a single call; pass a list as out to
+        # receive the strings instead
+        parts = [] if out is None else out
+        stack = []
+        cdef Node current = node
+        while stack or current is not self.NIL_LEAF:
+            while current is not self.NIL_LEAF:
+                stack.append(current)
+                current = current.left
+            node = stack.pop()
+            parts.append(f'{node.data} ({"RED" if node.color == RED else "BLACK"}, count={node.subtree_count})')
+            current = node.right
+        if out is None:
+            print(' '.join(parts), end=' ')